@@ -7,10 +7,25 @@ from dataclasses import dataclass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .component_api import ComponentApi
-from .const import DOMAIN, LOGGER
+from .const import (
+    DOMAIN,
+    LOGGER,
+    SIGNAL_ENTRY_LOADED,
+    SIGNAL_ENTRY_REMOVED,
+    SIGNAL_ENTRY_UNLOADED,
+)
+from .date_overrides import date_overrides_key
+from .flex_ledger import flex_ledger_key
+from .hass_util import StorageJson, check_supress_config_update_listener
+from .http_api import WageExportView
+from .month_store import month_store_key
+from .websocket_api import async_register_websocket_commands
 
 
 # ------------------------------------------------------------------
@@ -26,6 +41,17 @@ class CommonData:
 # The type alias needs to be suffixed with 'ConfigEntry'
 type CommonConfigEntry = ConfigEntry[CommonData]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+# ------------------------------------------------------------------
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Wage calculator integration."""
+
+    async_register_websocket_commands(hass)
+    hass.http.register_view(WageExportView())
+    return True
+
 
 # ------------------------------------------------------------------
 async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bool:
@@ -52,7 +78,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bo
 
     entry.async_on_unload(entry.add_update_listener(config_update_listener))
 
-    await hass.config_entries.async_forward_entry_setups(entry, [Platform.SENSOR])
+    await hass.config_entries.async_forward_entry_setups(
+        entry, [Platform.CALENDAR, Platform.SENSOR]
+    )
+
+    # Websocket subscriptions reattach to the new coordinator after a reload
+    async_dispatcher_send(hass, SIGNAL_ENTRY_LOADED.format(entry.entry_id))
     return True
 
 
@@ -60,7 +91,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bo
 async def async_unload_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bool:
     """Unload a config entry."""
 
-    return await hass.config_entries.async_unload_platforms(entry, [Platform.SENSOR])
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, [Platform.CALENDAR, Platform.SENSOR]
+    ):
+        # Websocket subscriptions are closed unless the entry is loaded again
+        async_dispatcher_send(hass, SIGNAL_ENTRY_UNLOADED.format(entry.entry_id))
+
+    return unload_ok
+
+
+# ------------------------------------------------------------------
+async def async_remove_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> None:
+    """Remove stored data of a config entry."""
+
+    async_dispatcher_send(hass, SIGNAL_ENTRY_REMOVED.format(entry.entry_id))
+    await StorageJson(hass, month_store_key(entry.entry_id)).async_remove_settings()
+    await StorageJson(hass, flex_ledger_key(entry.entry_id)).async_remove_settings()
+    await StorageJson(hass, date_overrides_key(entry.entry_id)).async_remove_settings()
 
 
 # ------------------------------------------------------------------
@@ -71,6 +118,7 @@ async def async_reload_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> N
 
 
 # ------------------------------------------------------------------
+@check_supress_config_update_listener()
 async def config_update_listener(
     hass: HomeAssistant,
     config_entry: CommonConfigEntry,
@@ -0,0 +1,252 @@
+"""Calendar for Wage calculator."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from . import CommonConfigEntry
+from .const import CALENDAR_CACHED_WINDOWS, DOMAIN
+from .domain_data import async_get_domain_data
+from .entity import ComponentEntity
+from .hass_util import Translate
+from .shift_index import ShiftIndex
+from .wage_calc import minutes_to_hours
+
+
+# ------------------------------------------------------
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: CommonConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Calendar setup."""
+
+    async_add_entities([WageCalcCalendar(hass, entry)])
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class WageCalcCalendar(ComponentEntity, CalendarEntity):
+    """Calendar with work shifts, holidays and flex hour adjustments."""
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: CommonConfigEntry,
+    ) -> None:
+        """Wage calculator calendar."""
+
+        super().__init__(entry.runtime_data.coordinator, entry)
+
+        self.hass: HomeAssistant = hass
+        self.entry: CommonConfigEntry = entry
+        self.component_api = entry.runtime_data.component_api
+        self.coordinator = entry.runtime_data.coordinator
+
+        self.translation_key = "shifts"
+
+        self._shift_summary: str = ""
+        self._flex_summary: str = ""
+        self._event: CalendarEvent | None = None
+        self._windows: dict[tuple, list[CalendarEvent]] = {}
+
+    # ------------------------------------------------------
+    @property
+    def name(self) -> str:
+        """Name.
+
+        Returns:
+            str: Name of calendar
+
+        """
+
+        return self.entry.title + " " + super().name
+
+    # ------------------------------------------------------
+    @property
+    def unique_id(self) -> str:
+        """Unique id.
+
+        Returns:
+            str: Unique  id
+
+        """
+        return self.entry.entry_id + "_wage_calculator_shifts"
+
+    # ------------------------------------------------------
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Current or next shift."""
+
+        return self._event
+
+    # ------------------------------------------------------
+    @property
+    def shift_index(self) -> ShiftIndex:
+        """Shift index of the entry."""
+
+        return self.component_api.shift_index
+
+    # ------------------------------------------------------
+    def _window_key(self, start: datetime, end: datetime) -> tuple:
+        """Key of a cached window, changes with the inputs and the flex ledger."""
+
+        return (
+            self.shift_index.validate(),
+            len(self.component_api.flex_ledger.entries),
+            self.component_api.flex_ledger.balance,
+            start,
+            end,
+        )
+
+    # ------------------------------------------------------
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Get events in a window, cached per window."""
+
+        tmp_key: tuple = self._window_key(start_date, end_date)
+
+        if (tmp_events := self._windows.get(tmp_key)) is not None:
+            return tmp_events
+
+        await async_get_domain_data(hass).holiday_provider.async_load_years(
+            self.component_api.calc_monthly_wage.holidays,
+            # The day after the window is in the next year for windows ending
+            # at midnight on new year's eve
+            range(start_date.year - 1, end_date.year + 2),
+        )
+        tmp_events = self._events(start_date, end_date)
+
+        # Windows cached for older inputs are never hit again
+        self._windows = {
+            key: events
+            for key, events in self._windows.items()
+            if key[0:3] == tmp_key[0:3]
+        }
+
+        if len(self._windows) >= CALENDAR_CACHED_WINDOWS:
+            del self._windows[next(iter(self._windows))]
+
+        self._windows[tmp_key] = tmp_events
+        return tmp_events
+
+    # ------------------------------------------------------
+    def _events(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        """Shifts, holidays and flex hour adjustments in a window."""
+
+        tmp_start_day: date = dt_util.as_local(start).date()
+        tmp_end_day: date = (
+            dt_util.as_local(end) - timedelta(microseconds=1)
+        ).date() + timedelta(days=1)
+
+        tmp_events: list[CalendarEvent] = [
+            CalendarEvent(start=shift_start, end=shift_end, summary=self._shift_summary)
+            for shift_start, shift_end in self.shift_index.shifts(start, end)
+        ]
+
+        tmp_events.extend(
+            CalendarEvent(start=day, end=day + timedelta(days=1), summary=name)
+            for day, name in self.shift_index.holidays(tmp_start_day, tmp_end_day)
+        )
+
+        # Adjustments of compacted months are a summary on the first of the month
+        for key, (net, *_rest) in self.component_api.flex_ledger.snapshots.items():
+            tmp_day: date = date.fromisoformat(f"{key}-01")
+
+            if tmp_start_day <= tmp_day < tmp_end_day:
+                tmp_events.append(
+                    CalendarEvent(
+                        start=tmp_day,
+                        end=tmp_day + timedelta(days=1),
+                        summary=f"{self._flex_summary} {minutes_to_hours(net):+}",
+                        description=key,
+                    )
+                )
+
+        for timestamp, minutes, source in self.component_api.flex_ledger.entries:
+            tmp_day = datetime.fromisoformat(timestamp).date()
+
+            if tmp_start_day <= tmp_day < tmp_end_day:
+                tmp_events.append(
+                    CalendarEvent(
+                        start=tmp_day,
+                        end=tmp_day + timedelta(days=1),
+                        summary=f"{self._flex_summary} {minutes_to_hours(minutes):+}",
+                        description=source,
+                    )
+                )
+
+        return tmp_events
+
+    # ------------------------------------------------------
+    async def _async_update_event(self) -> None:
+        """Update current or next shift.
+
+        Holidays of the years in the index are loaded in the executor first.
+        """
+
+        tmp_now: datetime = dt_util.now()
+        tmp_end: datetime = tmp_now + timedelta(days=8)
+
+        await async_get_domain_data(self.hass).holiday_provider.async_load_years(
+            self.component_api.calc_monthly_wage.holidays,
+            range((tmp_now - timedelta(days=1)).year, tmp_end.year + 1),
+        )
+        tmp_shifts: list[tuple[datetime, datetime]] = self.shift_index.shifts(
+            tmp_now, tmp_end
+        )
+
+        self._event = (
+            CalendarEvent(
+                start=tmp_shifts[0][0],
+                end=tmp_shifts[0][1],
+                summary=self._shift_summary,
+            )
+            if tmp_shifts
+            else None
+        )
+
+    # ------------------------------------------------------
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+
+        self.shift_index.validate()
+        self.entry.async_create_task(
+            self.hass,
+            self._async_handle_coordinator_update(),
+            f"{DOMAIN} calendar update {self.entry.title}",
+        )
+
+    # ------------------------------------------------------
+    async def _async_handle_coordinator_update(self) -> None:
+        """Update current or next shift, then write the state."""
+
+        await self._async_update_event()
+        super()._handle_coordinator_update()
+
+    # ------------------------------------------------------
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+
+        await super().async_added_to_hass()
+
+        self._shift_summary = await Translate(self.hass).async_get_localized_str(
+            "defaults.calendar_shift_summary", file_name="_defaults.json"
+        )
+        self._flex_summary = await Translate(self.hass).async_get_localized_str(
+            "defaults.calendar_flex_summary", file_name="_defaults.json"
+        )
+
+        self.shift_index.validate()
+        await self._async_update_event()
@@ -0,0 +1,192 @@
+"""Calendar overlay."""
+
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from hashlib import sha1
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+
+from .const import LOGGER
+
+# The state of a calendar entity only follows its current or next event, so
+# added, moved or removed events further ahead does not change the state and
+# are only picked up by refetching at this interval
+CALENDAR_REFRESH_INTERVAL = timedelta(hours=1)
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class CalendarOverlay:
+    """Calendar overlay.
+
+    Events in the linked calendar mark absences or extra shifts. All day events
+    are absences, timed events replaces the work hours of the day with the
+    duration of the events. Timed events crossing midnight are split between
+    the days.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        calendar_entity: str,
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.calendar_entity: str = calendar_entity
+
+        self.days: dict[date, int] = {}
+        self.fingerprint: str = ""
+
+        self._period: tuple[date, date] | None = None
+        self._fetched_at: datetime | None = None
+        self._stale: bool = True
+        self._unsub_state_change: Callable[[], None] | None = None
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Start listening for calendar changes."""
+
+        self._unsub_state_change = async_track_state_change_event(
+            self.hass, self.calendar_entity, self._async_calendar_changed
+        )
+        return self.async_stop
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening for calendar changes."""
+
+        if self._unsub_state_change is not None:
+            self._unsub_state_change()
+            self._unsub_state_change = None
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_calendar_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Calendar changed, fetch events at next refresh."""
+
+        self._stale = True
+
+    # ------------------------------------------------------------------
+    def needs_refresh(self, start: date, end: date) -> bool:
+        """Check if the cached events are outdated for the period.
+
+        The state change listener only catches changes to the current or next
+        event, so the events are also refetched after the refresh interval.
+        """
+
+        return (
+            self._stale
+            or self._period != (start, end)
+            or self._fetched_at is None
+            or dt_util.utcnow() - self._fetched_at >= CALENDAR_REFRESH_INTERVAL
+        )
+
+    # ------------------------------------------------------------------
+    async def async_refresh(self, start: date, end: date) -> bool:
+        """Refresh events for the period [start, end).
+
+        Returns True if the overlay has changed.
+        """
+
+        if not self.needs_refresh(start, end):
+            return False
+
+        try:
+            response = await self.hass.services.async_call(
+                "calendar",
+                "get_events",
+                {
+                    ATTR_ENTITY_ID: self.calendar_entity,
+                    "start_date_time": dt_util.start_of_local_day(start),
+                    "end_date_time": dt_util.start_of_local_day(end),
+                },
+                blocking=True,
+                return_response=True,
+            )
+        except HomeAssistantError as err:
+            LOGGER.warning(
+                "Unable to get events from %s: %s", self.calendar_entity, err
+            )
+            return False
+
+        self._stale = False
+        self._period = (start, end)
+        self._fetched_at = dt_util.utcnow()
+
+        events: list[dict] = (
+            (response or {}).get(self.calendar_entity, {}).get("events", [])
+        )
+
+        # Days are clipped to the period, so it is part of the fingerprint
+        tmp_fingerprint: str = sha1(
+            repr(
+                (
+                    start,
+                    end,
+                    sorted(
+                        (event["start"], event["end"], event.get("summary", ""))
+                        for event in events
+                    ),
+                )
+            ).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+
+        if tmp_fingerprint == self.fingerprint:
+            return False
+
+        self.fingerprint = tmp_fingerprint
+        self.days = self.events_to_days(events, start, end)
+        return True
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def events_to_days(events: list[dict], start: date, end: date) -> dict[date, int]:
+        """Convert calendar events to work minutes per day."""
+
+        tmp_days: dict[date, float] = {}
+        tmp_absent: set[date] = set()
+
+        for event in events:
+            if len(event["start"]) == 10:
+                tmp_day: date = date.fromisoformat(event["start"])
+                tmp_end: date = date.fromisoformat(event["end"])
+
+                while tmp_day < tmp_end:
+                    tmp_absent.add(tmp_day)
+                    tmp_day += timedelta(days=1)
+                continue
+
+            tmp_start_dt: datetime = dt_util.as_local(
+                datetime.fromisoformat(event["start"])
+            )
+            tmp_end_dt: datetime = dt_util.as_local(
+                datetime.fromisoformat(event["end"])
+            )
+
+            while tmp_start_dt < tmp_end_dt:
+                tmp_day = tmp_start_dt.date()
+                tmp_midnight: datetime = dt_util.start_of_local_day(
+                    tmp_day + timedelta(days=1)
+                )
+                tmp_days[tmp_day] = (
+                    tmp_days.get(tmp_day, 0.0)
+                    + (min(tmp_end_dt, tmp_midnight) - tmp_start_dt).total_seconds()
+                )
+                tmp_start_dt = tmp_midnight
+
+        for tmp_day in tmp_absent:
+            tmp_days.setdefault(tmp_day, 0.0)
+
+        return {
+            tmp_day: round(seconds / 60)
+            for tmp_day, seconds in tmp_days.items()
+            if start <= tmp_day < end
+        }
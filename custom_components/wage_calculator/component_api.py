@@ -1,25 +1,66 @@
 """Component api."""
 
+from asyncio import Task, shield
 from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
 
-from babel.numbers import format_decimal, get_currency_symbol
+from babel.numbers import format_decimal, get_currency_precision, get_currency_symbol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_COUNTRY_CODE
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_COUNTRY_CODE, CONF_NAME, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
+from .calendar_overlay import CalendarOverlay
 from .const import (
+    CONF_AUTO_RESET_FLEX_HOURS,
+    CONF_CALENDAR_ENTITY,
+    CONF_EXCLUDE_DATES,
     CONF_FLEX_HOURS,
+    CONF_HOLIDAY_COMBINE,
+    CONF_HOLIDAY_SOURCES,
     CONF_HOURLY_WAGE,
+    CONF_INCLUDE_DATES,
+    CONF_PRESENCE_ENTITY,
+    CONF_RESET_FLEX_DATE,
+    CONF_ROTATION_START,
+    CONF_ROTATION_WEEKS,
+    CONF_SCHEDULE_WORK_HOURS,
+    CONF_SUBDIVISION,
+    CONF_TAX_TABLE,
     CONF_UPDATE_CONTINUOUSLY,
     CONF_WORK_HOURS,
     CONF_WORK_STARTS,
+    DOMAIN,
+    FLEX_HOURS_SAVE_DELAY,
+    LOGGER,
+    TAX_TABLES_DIR,
     DayOfWeekEnum,
+    HolidayCombineEnum,
+    work_day_key,
 )
-from .hass_util import Translate, async_hass_add_executor_job
-from .wage_calc import WageCalc
+from .date_overrides import DateOverrides
+from .domain_data import async_get_domain_data
+from .flex_ledger import FlexLedger
+from .hass_util import (
+    TimerScheduler,
+    Translate,
+    async_hass_add_executor_job,
+    set_supress_config_update_listener,
+)
+from .holiday_set import HolidaySet
+from .month_store import MonthAggregateStore
+from .presence_tracker import PresenceTracker
+from .shift_index import ShiftIndex
+from .tax_table import TaxTable, load_tax_table
+from .wage_calc import WageCalc, hours_to_minutes, minutes_to_hours
+from .work_schedule import SimulationScenario
 
 
 # ------------------------------------------------------------------
@@ -39,24 +80,29 @@ class ComponentApi:
         self.coordinator: DataUpdateCoordinator = coordinator
         self.entry: ConfigEntry = entry
 
-        self.calc_monthly_wage: WageCalc = WageCalc(
-            hass,
-            [
-                entry.options.get(CONF_WORK_HOURS + str(i), 0.0)
-                for i in DayOfWeekEnum.range()
-            ],
-            [
-                entry.options.get(CONF_WORK_STARTS + str(i), "00:00:00")
-                for i in DayOfWeekEnum.range()
-            ],
-            hourly_wage=entry.options.get(CONF_HOURLY_WAGE, 0.0),
-            flex_hours=entry.options.get(CONF_FLEX_HOURS, 0.0),
-            country=entry.options.get(CONF_COUNTRY_CODE, "DK"),
-            update_continuously=entry.options.get(CONF_UPDATE_CONTINUOUSLY, False),
-        )
+        self.calendar_overlay: CalendarOverlay | None = None
+
+        if entry.options.get(CONF_CALENDAR_ENTITY, ""):
+            self.calendar_overlay = CalendarOverlay(
+                hass, entry.options[CONF_CALENDAR_ENTITY]
+            )
+
+        self.presence_tracker: PresenceTracker | None = None
+
+        if entry.options.get(CONF_PRESENCE_ENTITY, ""):
+            self.presence_tracker = PresenceTracker(
+                hass, entry.options[CONF_PRESENCE_ENTITY]
+            )
 
         self.markdown: str = ""
 
+        self._update_task: Task[bool] | None = None
+        self._update_requested: bool = False
+        self._unsub_save_config: CALLBACK_TYPE | None = None
+        self._save_config_options: tuple[Any, Any] = ()
+        self._unsub_flex_reset: CALLBACK_TYPE | None = None
+        self.reset_flex_date: str = entry.options.get(CONF_RESET_FLEX_DATE, "")
+
     # -------------------------------------------------------------------
     async def async_init(self) -> None:
         """Init."""
@@ -83,8 +129,101 @@ class ComponentApi:
         )
 
         self.currency_sign: str = await self.get_currency_symb()
+
+        tmp_weeks: range = range(
+            1, int(self.entry.options.get(CONF_ROTATION_WEEKS, 1)) + 1
+        )
+
+        self.calc_monthly_wage: WageCalc = WageCalc(
+            self.hass,
+            [
+                self.entry.options.get(work_day_key(CONF_WORK_HOURS, i, week), 0.0)
+                for week in tmp_weeks
+                for i in DayOfWeekEnum.range()
+            ],
+            [
+                self.entry.options.get(
+                    work_day_key(CONF_WORK_STARTS, i, week), "00:00:00"
+                )
+                for week in tmp_weeks
+                for i in DayOfWeekEnum.range()
+            ],
+            hourly_wage=self.entry.options.get(CONF_HOURLY_WAGE, 0.0),
+            flex_hours=self.entry.options.get(CONF_FLEX_HOURS, 0.0),
+            country=self.entry.options.get(CONF_COUNTRY_CODE, "DK"),
+            update_continuously=self.entry.options.get(CONF_UPDATE_CONTINUOUSLY, False),
+            currency_digits=await self.get_currency_digits(),
+            holiday_sources=self.holiday_sources(),
+            holiday_intersection=self.entry.options.get(
+                CONF_HOLIDAY_COMBINE, HolidayCombineEnum.UNION
+            )
+            == HolidayCombineEnum.INTERSECTION,
+            include_dates=[
+                date.fromisoformat(day)
+                for day in self.entry.options.get(CONF_INCLUDE_DATES, [])
+            ],
+            exclude_dates=[
+                date.fromisoformat(day)
+                for day in self.entry.options.get(CONF_EXCLUDE_DATES, [])
+            ],
+            include_name=await Translate(self.hass).async_get_localized_str(
+                "defaults.include_date_name", file_name="_defaults.json"
+            ),
+            rotation_start=date.fromisoformat(self.entry.options[CONF_ROTATION_START])
+            if self.entry.options.get(CONF_ROTATION_START)
+            else None,
+        )
+
+        self.calc_monthly_wage.tax_table = await self.load_tax_table(
+            self.tax_table_name()
+        )
+
+        # The month store signature includes the holidays signature
+        await self.calc_monthly_wage.async_get_holidays()
+
+        self.date_overrides: DateOverrides = DateOverrides(
+            self.hass, self.entry.entry_id
+        )
+        await self.date_overrides.async_load()
+        self.entry.async_on_unload(self.date_overrides.async_flush)
+        self.calc_monthly_wage.date_overrides = self.date_overrides.days
+
+        self.month_store: MonthAggregateStore = MonthAggregateStore(
+            self.hass, self.entry.entry_id, self.calc_monthly_wage
+        )
+        await self.month_store.async_load()
+
+        self.shift_index: ShiftIndex = ShiftIndex(self.calc_monthly_wage)
+
+        self.flex_ledger: FlexLedger = FlexLedger(self.hass, self.entry.entry_id)
+        await self.flex_ledger.async_load()
+        self.entry.async_on_unload(self.flex_ledger.async_flush)
+
+        # Flex hours changed in the options flow, or ledger not created yet
+        self.flex_ledger.append(
+            self.calc_monthly_wage.flex_minutes - self.flex_ledger.balance, "options"
+        )
+        self.async_start_flex_reset()
+
+        if self.calendar_overlay is not None:
+            self.entry.async_on_unload(self.calendar_overlay.async_start())
+
+        await self.async_refresh_calendar_overlay()
+        await self.async_refresh_presence()
         await self.calc_monthly_wage.async_init()
+        await self.month_store.async_save()
         self.markdown = await self.async_create_markdown()
+        self._last_result: tuple = self.result_key()
+
+        self.entry.async_on_unload(
+            async_get_domain_data(self.hass).ticker.async_add(self)
+        )
+        self.entry.async_on_unload(self.async_flush_config)
+        self.entry.async_on_unload(
+            self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_hass_stop
+            )
+        )
 
     # -------------------------------------------------------------------
     @async_hass_add_executor_job()
@@ -96,13 +235,192 @@ class ComponentApi:
         )
 
     # -------------------------------------------------------------------
-    async def async_update(self) -> None:
-        """Update."""
+    @async_hass_add_executor_job()
+    def get_currency_digits(self) -> int:
+        """Get number of decimal digits of the currency."""
+
+        return get_currency_precision(self.hass.config.currency)
+
+    # -------------------------------------------------------------------
+    def tax_table_name(self) -> str:
+        """Name of the tax table, the country by default."""
+
+        return self.entry.options.get(CONF_TAX_TABLE) or self.entry.options.get(
+            CONF_COUNTRY_CODE, "DK"
+        )
+
+    # -------------------------------------------------------------------
+    @async_hass_add_executor_job()
+    def load_tax_table(self, name: str) -> TaxTable | None:
+        """Load a tax table from the config directory, None if missing."""
+
+        try:
+            return load_tax_table(
+                Path(self.hass.config.path(DOMAIN, TAX_TABLES_DIR, f"{name}.json")),
+                self.calc_monthly_wage.currency_digits,
+            )
+        except (TypeError, ValueError) as err:
+            LOGGER.warning("Net pay is not estimated: %s", err)
+            return None
+
+    # -------------------------------------------------------------------
+    def holiday_sources(self) -> list[str]:
+        """Holiday sources, the country and subdivision first."""
+
+        tmp_source: str = self.entry.options.get(CONF_COUNTRY_CODE, "DK")
+
+        if tmp_subdivision := self.entry.options.get(CONF_SUBDIVISION, ""):
+            tmp_source += "-" + tmp_subdivision
+
+        return [tmp_source] + [
+            source
+            for source in self.entry.options.get(CONF_HOLIDAY_SOURCES, [])
+            if source != tmp_source
+        ]
+
+    # -------------------------------------------------------------------
+    async def async_refresh_calendar_overlay(self) -> None:
+        """Refresh calendar overlay for the current year.
+
+        All months of the year are covered, so the year to date and the full
+        year includes the absences and extra shifts of the other months. The
+        aggregates of months where days changed are recalculated.
+        """
+
+        if self.calendar_overlay is None:
+            return
+
+        tmp_start: date = date.today().replace(month=1, day=1)
+        tmp_days: dict[date, int] = self.calendar_overlay.days
+
+        if await self.calendar_overlay.async_refresh(
+            tmp_start, tmp_start.replace(year=tmp_start.year + 1)
+        ):
+            self.calc_monthly_wage.calendar_overlay = self.calendar_overlay.days
+
+            for year, month in {
+                (day.year, day.month)
+                for day, _minutes in (
+                    tmp_days.items() ^ self.calendar_overlay.days.items()
+                )
+            }:
+                self.calc_monthly_wage.clear_month_aggregates(year, month)
+
+    # -------------------------------------------------------------------
+    async def async_refresh_presence(self) -> None:
+        """Refresh worked hours from the presence entity."""
+
+        if self.presence_tracker is None:
+            return
+
+        await self.presence_tracker.async_update()
+        self.calc_monthly_wage.worked_minutes = self.presence_tracker.worked_minutes()
+
+    # -------------------------------------------------------------------
+    def result_key(self) -> tuple:
+        """Key of the calculated values, used to detect changes."""
+
+        return (
+            self.calc_monthly_wage.result_key(),
+            None if self.calc_monthly_wage.earning else self.markdown,
+        )
+
+    # -------------------------------------------------------------------
+    def result_fields(self) -> dict[str, Any]:
+        """Calculated values converted for display, keyed by field name."""
+
+        tmp_calc: WageCalc = self.calc_monthly_wage
+
+        return {
+            "salary": tmp_calc.to_amount(tmp_calc.salary_minor),
+            "salary_before_today": tmp_calc.to_amount(
+                tmp_calc.salary_before_today_minor
+            ),
+            "salary_after_today": tmp_calc.to_amount(tmp_calc.salary_after_today_minor),
+            "earned": tmp_calc.to_amount(
+                tmp_calc.salery_before_today_with_hourly_update_minor
+            ),
+            "earned_at": tmp_calc.anchor_at.isoformat() if tmp_calc.anchor_at else None,
+            "earning_rate": tmp_calc.to_amount(tmp_calc.earning_rate_minor),
+            "rate_changes_at": (
+                tmp_calc.rate_changes_at.isoformat()
+                if tmp_calc.rate_changes_at
+                else None
+            ),
+            "total_hours": minutes_to_hours(tmp_calc.total_minutes),
+            "total_hours_before_today": minutes_to_hours(
+                tmp_calc.total_minutes_before_today
+            ),
+            "total_hours_after_today": minutes_to_hours(
+                tmp_calc.total_minutes_after_today
+            ),
+            "today_hours": minutes_to_hours(tmp_calc.today_minutes),
+            "month_work_days": tmp_calc.month_work_days,
+            "month_work_days_before_today": tmp_calc.month_work_days_before_today,
+            "month_work_days_after_today": tmp_calc.month_work_days_after_today,
+            "flex_hours": tmp_calc.flex_hours,
+            "flex_hours_month": minutes_to_hours(
+                self.flex_ledger.month_net(tmp_calc.year, tmp_calc.month)
+            ),
+            "salary_ytd": tmp_calc.to_amount(tmp_calc.ytd_salary_minor),
+            "salary_year": tmp_calc.to_amount(tmp_calc.year_salary_minor),
+            "total_hours_ytd": minutes_to_hours(tmp_calc.ytd_minutes),
+            "total_hours_year": minutes_to_hours(tmp_calc.year_minutes),
+            "currency": self.currency_sign,
+            "markdown": self.markdown,
+        }
+
+    # -------------------------------------------------------------------
+    async def async_update(self) -> bool:
+        """Update.
+
+        Only one update runs at a time. Callers arriving while an update runs
+        awaits the same update, which is followed by at most one more update
+        so all callers gets values calculated after their request.
+
+        Returns True if the calculated values has changed.
+        """
 
+        if self._update_task is not None and not self._update_task.done():
+            self._update_requested = True
+        else:
+            self._update_task = self.hass.async_create_task(
+                self._async_update_coalesced(), f"{DOMAIN} update {self.entry.title}"
+            )
+
+        return await shield(self._update_task)
+
+    # -------------------------------------------------------------------
+    async def _async_update_coalesced(self) -> bool:
+        """Update until no more updates are requested."""
+
+        tmp_changed: bool = False
+
+        while True:
+            self._update_requested = False
+            tmp_changed = await self._async_update() or tmp_changed
+
+            if not self._update_requested:
+                return tmp_changed
+
+    # -------------------------------------------------------------------
+    async def _async_update(self) -> bool:
+        """Calculate values and markdown."""
+
+        await self.async_refresh_calendar_overlay()
+        await self.async_refresh_presence()
+        await self.calc_monthly_wage.async_load_holidays()
         self.calc_monthly_wage.calculate()
+        await self.month_store.async_save()
 
         self.markdown = await self.async_create_markdown()
 
+        tmp_result: tuple = self.result_key()
+        tmp_changed: bool = tmp_result != self._last_result
+        self._last_result = tmp_result
+
+        return tmp_changed
+
     @async_hass_add_executor_job()
     # ------------------------------------------------------------------
     def format_decimal(self, number: float, format: str = "#,###,##0.00") -> str:
@@ -116,7 +434,7 @@ class ComponentApi:
 
         tmp_hours: str = ""
 
-        if self.calc_monthly_wage.today_hours > 0:
+        if self.calc_monthly_wage.today_minutes > 0:
             value_template: Template | None = Template(
                 self._md_today_hours_template, self.hass
             )
@@ -124,7 +442,8 @@ class ComponentApi:
                 value_template.async_render(
                     {
                         "today_hours": await self.format_decimal(
-                            self.calc_monthly_wage.today_hours, "#,###,##0.0"
+                            minutes_to_hours(self.calc_monthly_wage.today_minutes),
+                            "#,###,##0.0",
                         )
                     }
                 )
@@ -136,14 +455,18 @@ class ComponentApi:
             "currency_sign": self.currency_sign,
             "tmp_hours": tmp_hours,
             "today_hours": await self.format_decimal(
-                self.calc_monthly_wage.today_hours, "#,###,##0.0"
+                minutes_to_hours(self.calc_monthly_wage.today_minutes), "#,###,##0.0"
             ),
             "month_work_days_before_today": self.calc_monthly_wage.month_work_days_before_today,
             "salery_before_today_with_hourly_update": await self.format_decimal(
-                self.calc_monthly_wage.salery_before_today_with_hourly_update
+                self.calc_monthly_wage.to_amount(
+                    self.calc_monthly_wage.salery_before_today_with_hourly_update_minor
+                )
             ),
             "month_work_days_after_today": self.calc_monthly_wage.month_work_days_after_today,
-            "salary": await self.format_decimal(self.calc_monthly_wage.salary),
+            "salary": await self.format_decimal(
+                self.calc_monthly_wage.to_amount(self.calc_monthly_wage.salary_minor)
+            ),
         }
 
         tmp_after: str = ""
@@ -163,14 +486,337 @@ class ComponentApi:
         return value_template.async_render(values)
 
     # ------------------------------------------------------------------
-    # @set_supress_config_update_listener()
-    # async def update_config(self) -> None:
-    #     """Update config."""
+    @callback
+    def async_set_flex_hours(self, hours: float, source: str) -> None:
+        """Set flex hours, the adjustment is recorded in the flex ledger."""
+
+        tmp_minutes: int = hours_to_minutes(hours)
+
+        self.flex_ledger.append(
+            tmp_minutes - self.calc_monthly_wage.flex_minutes, source
+        )
+        self.calc_monthly_wage.flex_minutes = tmp_minutes
+        self.async_schedule_update_config()
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_add_flex_hours(self, hours: float, source: str) -> None:
+        """Add flex hours, the adjustment is recorded in the flex ledger."""
+
+        tmp_minutes: int = hours_to_minutes(hours)
+
+        self.flex_ledger.append(tmp_minutes, source)
+        self.calc_monthly_wage.flex_minutes += tmp_minutes
+        self.async_schedule_update_config()
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_set_date_overrides(
+        self, start: date, end: date, hours: float | None
+    ) -> None:
+        """Set work hours of the days from start to end, None removes them.
+
+        Only the month aggregates of the changed months are recalculated, the
+        entry is not reloaded.
+        """
+
+        tmp_days: list[date] = [
+            start + timedelta(days=days) for days in range((end - start).days + 1)
+        ]
+
+        self.date_overrides.set(
+            tmp_days, None if hours is None else hours_to_minutes(hours)
+        )
+
+        for year, month in {(day.year, day.month) for day in tmp_days}:
+            self.calc_monthly_wage.clear_month_aggregates(year, month)
+
+    # ------------------------------------------------------------------
+    async def async_simulate(
+        self, schedules: list[dict[str, Any]], start: date, end: date, monthly: bool
+    ) -> list[dict[str, Any]]:
+        """Simulate hypothetical schedules from start to end, both included.
+
+        Holidays, hourly wage, rotation start and tax table default to those
+        of the entry. Only the scheduled work is simulated, flex hours, date
+        overrides and the calendar are left out.
+        """
+
+        tmp_calc: WageCalc = self.calc_monthly_wage
+        tmp_provider = async_get_domain_data(self.hass).holiday_provider
+        tmp_years: range = range(start.year, end.year + 1)
+        tmp_scenarios: list[SimulationScenario] = []
+
+        for index, schedule in enumerate(schedules, 1):
+            tmp_holidays: HolidaySet = tmp_calc.holidays
+
+            if (tmp_source := schedule.get(CONF_COUNTRY_CODE)) is not None:
+                try:
+                    tmp_holidays = HolidaySet(
+                        [await tmp_provider.async_get_holidays(tmp_source)]
+                    )
+                except NotImplementedError as err:
+                    raise ServiceValidationError(
+                        translation_domain=DOMAIN,
+                        translation_key="invalid_holiday_source",
+                        translation_placeholders={"source": tmp_source},
+                    ) from err
+
+            await tmp_provider.async_load_years(tmp_holidays, tmp_years)
+
+            tmp_tax_table: TaxTable | None = tmp_calc.tax_table
+
+            if (tmp_name := schedule.get(CONF_TAX_TABLE)) is not None and (
+                tmp_tax_table := await self.load_tax_table(tmp_name)
+            ) is None:
+                raise ServiceValidationError(
+                    translation_domain=DOMAIN,
+                    translation_key="invalid_tax_table",
+                    translation_placeholders={"name": tmp_name},
+                )
+
+            tmp_scenarios.append(
+                SimulationScenario(
+                    schedule.get(CONF_NAME, str(index)),
+                    schedule[CONF_SCHEDULE_WORK_HOURS],
+                    schedule.get(CONF_ROTATION_START)
+                    or (
+                        date.fromisoformat(self.entry.options[CONF_ROTATION_START])
+                        if self.entry.options.get(CONF_ROTATION_START)
+                        else None
+                    ),
+                    round(schedule[CONF_HOURLY_WAGE] * 10**tmp_calc.currency_digits)
+                    if CONF_HOURLY_WAGE in schedule
+                    else tmp_calc.hourly_wage_minor,
+                    {year: tmp_holidays.year_mask(year) for year in tmp_years},
+                    tmp_tax_table,
+                )
+            )
+
+        tmp_results: list[dict] = await async_get_domain_data(
+            self.hass
+        ).simulator.async_simulate(tmp_scenarios, start, end, monthly)
+
+        return [
+            {
+                "name": result["name"],
+                "work_days": result["work_days"],
+                "hours": minutes_to_hours(result["minutes"]),
+                "wage": tmp_calc.to_amount(result["wage_minor"]),
+                **(
+                    {"net_wage": tmp_calc.to_amount(result["net_minor"])}
+                    if "net_minor" in result
+                    else {}
+                ),
+                **(
+                    {
+                        "months": [
+                            {
+                                "month": month["month"],
+                                "work_days": month["work_days"],
+                                "hours": minutes_to_hours(month["minutes"]),
+                                "wage": tmp_calc.to_amount(month["wage_minor"]),
+                                **(
+                                    {"net_wage": tmp_calc.to_amount(month["net_minor"])}
+                                    if "net_minor" in month
+                                    else {}
+                                ),
+                            }
+                            for month in result["months"]
+                        ]
+                    }
+                    if monthly
+                    else {}
+                ),
+            }
+            for result in tmp_results
+        ]
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_reset_flex_hours(self) -> None:
+        """Reset flex hours."""
+
+        self.async_set_flex_hours(0.0, "auto_reset")
+        self.reset_flex_date = dt_util.utcnow().isoformat()
+        self.async_schedule_update_config()
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_start_flex_reset(self) -> None:
+        """Start monthly flex hours reset.
+
+        A reset missed while Home Assistant was down is done right away.
+        """
+
+        if not self.entry.options.get(CONF_AUTO_RESET_FLEX_HOURS, False):
+            return
+
+        tmp_month_start: datetime = dt_util.start_of_local_day(
+            dt_util.now().date().replace(day=1)
+        )
+
+        if self.reset_flex_date == "":
+            self.reset_flex_date = dt_util.utcnow().isoformat()
+            self.async_schedule_update_config()
+
+        elif datetime.fromisoformat(self.reset_flex_date) < tmp_month_start:
+            self.async_reset_flex_hours()
+
+        self.entry.async_on_unload(self.async_stop_flex_reset)
+        self._async_track_next_flex_reset()
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_track_next_flex_reset(self) -> None:
+        """Track the start of the next month in local time."""
+
+        tmp_month_start: date = dt_util.now().date().replace(day=1)
+        tmp_next_month: date = (tmp_month_start + timedelta(days=32)).replace(day=1)
+
+        self._unsub_flex_reset = TimerScheduler.async_get(self.hass).async_schedule(
+            dt_util.start_of_local_day(tmp_next_month), self._async_flex_reset
+        )
+
+    # ------------------------------------------------------------------
+    async def _async_flex_reset(self, _now: datetime) -> None:
+        """Reset flex hours at the start of a month and track the next."""
+
+        self._unsub_flex_reset = None
+        self.async_reset_flex_hours()
+        self.async_flush_config()
+        self._async_track_next_flex_reset()
+        await self.coordinator.async_refresh()
+
+    # ------------------------------------------------------------------
+    def flex_hours_history(self, start: date, end: date) -> list[dict[str, Any]]:
+        """Net adjustment and closing balance of the flex hours per month."""
+
+        tmp_months: list[dict[str, Any]] = []
+        tmp_year, tmp_month = start.year, start.month
+
+        while (tmp_year, tmp_month) <= (end.year, end.month):
+            tmp_months.append(
+                {
+                    "month": f"{tmp_year:04d}-{tmp_month:02d}",
+                    "net": minutes_to_hours(
+                        self.flex_ledger.month_net(tmp_year, tmp_month)
+                    ),
+                    "balance": minutes_to_hours(
+                        self.flex_ledger.month_balance(tmp_year, tmp_month)
+                    ),
+                }
+            )
+
+            if tmp_month == 12:
+                tmp_year, tmp_month = tmp_year + 1, 1
+            else:
+                tmp_month += 1
+
+        return tmp_months
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_stop_flex_reset(self) -> None:
+        """Stop monthly flex hours reset."""
+
+        if self._unsub_flex_reset is not None:
+            self._unsub_flex_reset()
+            self._unsub_flex_reset = None
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_schedule_update_config(self) -> None:
+        """Schedule update of the config entry after a quiet period.
+
+        Flex hours are changed in memory right away, a burst of changes is
+        written to the config entry once. The flex options of the entry are
+        remembered, so the write is dropped if they are changed elsewhere.
+        """
+
+        if self._unsub_save_config is not None:
+            self._unsub_save_config()
+        else:
+            self._save_config_options = self.flex_options()
+
+        self._unsub_save_config = async_call_later(
+            self.hass, FLEX_HOURS_SAVE_DELAY, self._async_save_config_later
+        )
 
-    #     tmp_options: dict[str, Any] = self.entry.options.copy()
-    #     tmp_options[CONF_RESET_FLEX_DATE] = datetime.now(UTC).isoformat()
-    #     tmp_options[CONF_FLEX_HOURS] = 0.0
+    # ------------------------------------------------------------------
+    @callback
+    def _async_save_config_later(self, _now: datetime) -> None:
+        """Save config when the quiet period has passed."""
 
-    #     self.hass.config_entries.async_update_entry(
-    #         self.entry, data=tmp_options, options=tmp_options
-    #     )
+        self._unsub_save_config = None
+        self._async_save_pending_config()
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_flush_config(self) -> None:
+        """Write pending config changes now."""
+
+        if self._unsub_save_config is None:
+            return
+
+        self._unsub_save_config()
+        self._unsub_save_config = None
+        self._async_save_pending_config()
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_save_pending_config(self) -> None:
+        """Save pending config, unless the entry was updated meanwhile.
+
+        Like when flex hours are saved in the options flow, which reloads the
+        entry and flushes pending changes made before the options were saved.
+        """
+
+        if self.flex_options() != self._save_config_options:
+            LOGGER.debug(
+                "Flex hours of %s changed in the options, pending save dropped",
+                self.entry.title,
+            )
+            return
+
+        self.save_config()
+
+    # ------------------------------------------------------------------
+    def flex_options(self) -> tuple[Any, Any]:
+        """Flex hours and reset date in the config entry options."""
+
+        return (
+            self.entry.options.get(CONF_FLEX_HOURS),
+            self.entry.options.get(CONF_RESET_FLEX_DATE),
+        )
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_hass_stop(self, _event: Event) -> None:
+        """Write pending config changes on shutdown."""
+
+        self.async_flush_config()
+
+    # ------------------------------------------------------------------
+    def save_config(self) -> None:
+        """Update config if flex hours or reset date has changed."""
+
+        if (
+            self.entry.options.get(CONF_FLEX_HOURS)
+            != (self.calc_monthly_wage.flex_hours)
+            or self.entry.options.get(CONF_RESET_FLEX_DATE) != self.reset_flex_date
+        ):
+            self.update_config()
+
+    # ------------------------------------------------------------------
+    @set_supress_config_update_listener()
+    def update_config(self) -> None:
+        """Update config."""
+
+        tmp_options: dict[str, Any] = self.entry.options.copy()
+        tmp_options[CONF_FLEX_HOURS] = self.calc_monthly_wage.flex_hours
+        tmp_options[CONF_RESET_FLEX_DATE] = self.reset_flex_date
+
+        self.hass.config_entries.async_update_entry(
+            self.entry, data=tmp_options, options=tmp_options
+        )
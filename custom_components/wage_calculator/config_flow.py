@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from datetime import UTC, datetime
+from collections.abc import Callable, Coroutine, Mapping
+from datetime import UTC, date, datetime
+from functools import partial
 from typing import Any, cast
 
 import voluptuous as vol
@@ -14,30 +15,98 @@ from homeassistant.helpers import selector
 from homeassistant.helpers.schema_config_entry_flow import (
     SchemaCommonFlowHandler,
     SchemaConfigFlowHandler,
+    SchemaFlowError,
     SchemaFlowFormStep,
     SchemaFlowMenuStep,
 )
 from homeassistant.helpers.selector import (
     BooleanSelector,
     CountrySelector,
+    DateSelector,
+    EntitySelector,
+    EntitySelectorConfig,
     NumberSelector,
     NumberSelectorMode,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+    TextSelector,
+    TextSelectorConfig,
     TimeSelector,
 )
 from homeassistant.util.uuid import random_uuid_hex
 
 from .const import (
     CONF_AUTO_RESET_FLEX_HOURS,
+    CONF_CALENDAR_ENTITY,
+    CONF_EXCLUDE_DATES,
     CONF_FLEX_HOURS,
+    CONF_HOLIDAY_COMBINE,
+    CONF_HOLIDAY_SOURCES,
     CONF_HOURLY_WAGE,
+    CONF_INCLUDE_DATES,
+    CONF_PRESENCE_ENTITY,
     CONF_RESET_FLEX_DATE,
+    CONF_ROTATION_START,
+    CONF_ROTATION_WEEKS,
+    CONF_SUBDIVISION,
+    CONF_TAX_TABLE,
     CONF_UPDATE_CONTINUOUSLY,
     CONF_WORK_HOURS,
     CONF_WORK_STARTS,
     DOMAIN,
+    HOLIDAY_SOURCE_PATTERN,
+    ROTATION_MAX_WEEKS,
+    TAX_TABLE_PATTERN,
     DayOfWeekEnum,
+    HolidayCombineEnum,
+    work_day_key,
 )
 from .hass_util import NumberSelectorConfigTranslate
+from .holiday_dataset import split_holiday_source
+
+
+# ------------------------------------------------------------------
+def _supported_holiday_countries() -> dict[str, list[str]]:
+    """Countries and their subdivisions supported by the holidays package.
+
+    Blocking, must be run in the executor.
+    """
+
+    from holidays import list_supported_countries
+
+    return list_supported_countries()
+
+
+# ------------------------------------------------------------------
+async def _async_validate_holiday_sources(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> None:
+    """Validate the country, subdivision and holiday sources are supported."""
+
+    tmp_supported: dict[
+        str, list[str]
+    ] = await handler.parent_handler.hass.async_add_executor_job(
+        _supported_holiday_countries
+    )
+
+    if (tmp_country := user_input.get(CONF_COUNTRY_CODE)) is not None:
+        if tmp_country not in tmp_supported:
+            raise SchemaFlowError("unsupported_country")
+
+        if (
+            tmp_subdivision := user_input.get(CONF_SUBDIVISION)
+        ) is not None and tmp_subdivision not in tmp_supported[tmp_country]:
+            raise SchemaFlowError("invalid_subdivision")
+
+    for source in user_input.get(CONF_HOLIDAY_SOURCES, []):
+        tmp_country, tmp_subdivision = split_holiday_source(source)
+
+        if tmp_country not in tmp_supported or (
+            tmp_subdivision is not None
+            and tmp_subdivision not in tmp_supported[tmp_country]
+        ):
+            raise SchemaFlowError("invalid_holiday_source")
 
 
 async def _validate_input(
@@ -47,6 +116,42 @@ async def _validate_input(
     # if len(user_input[CONF_CALENDAR_ENTITY_IDS]) == 0:
     #     raise SchemaFlowError("missing_selection")
 
+    if tmp_subdivision := user_input.get(CONF_SUBDIVISION, "").strip().upper():
+        user_input[CONF_SUBDIVISION] = tmp_subdivision
+    else:
+        user_input.pop(CONF_SUBDIVISION, None)
+
+    if CONF_HOLIDAY_SOURCES in user_input:
+        user_input[CONF_HOLIDAY_SOURCES] = [
+            source.strip().upper() for source in user_input[CONF_HOLIDAY_SOURCES]
+        ]
+
+    for source in user_input.get(CONF_HOLIDAY_SOURCES, []):
+        if not HOLIDAY_SOURCE_PATTERN.fullmatch(source):
+            raise SchemaFlowError("invalid_holiday_source")
+
+    if CONF_COUNTRY_CODE in user_input or user_input.get(CONF_HOLIDAY_SOURCES):
+        await _async_validate_holiday_sources(handler, user_input)
+
+    # The start anchors the weeks of the rotation to the calendar
+    if int(user_input.get(CONF_ROTATION_WEEKS, 1)) > 1 and not user_input.get(
+        CONF_ROTATION_START
+    ):
+        raise SchemaFlowError("rotation_start_required")
+
+    if (tmp_tax_table := user_input.get(CONF_TAX_TABLE)) and not (
+        TAX_TABLE_PATTERN.fullmatch(tmp_tax_table)
+    ):
+        raise SchemaFlowError("invalid_tax_table")
+
+    try:
+        for day in user_input.get(CONF_INCLUDE_DATES, []) + user_input.get(
+            CONF_EXCLUDE_DATES, []
+        ):
+            date.fromisoformat(day)
+    except ValueError as err:
+        raise SchemaFlowError("invalid_date") from err
+
     return user_input
 
 
@@ -66,6 +171,28 @@ async def config_options_dict(handler: SchemaCommonFlowHandler) -> dict:
             CONF_COUNTRY_CODE,
             default=handler.parent_handler.hass.config.country,
         ): CountrySelector(),
+        vol.Optional(
+            CONF_SUBDIVISION,
+        ): TextSelector(),
+        vol.Optional(
+            CONF_HOLIDAY_SOURCES,
+        ): TextSelector(TextSelectorConfig(multiple=True)),
+        vol.Required(
+            CONF_HOLIDAY_COMBINE,
+            default=HolidayCombineEnum.UNION,
+        ): SelectSelector(
+            SelectSelectorConfig(
+                options=[combine.value for combine in HolidayCombineEnum],
+                mode=SelectSelectorMode.DROPDOWN,
+                translation_key=CONF_HOLIDAY_COMBINE,
+            )
+        ),
+        vol.Optional(
+            CONF_INCLUDE_DATES,
+        ): TextSelector(TextSelectorConfig(multiple=True)),
+        vol.Optional(
+            CONF_EXCLUDE_DATES,
+        ): TextSelector(TextSelectorConfig(multiple=True)),
         vol.Required(
             CONF_HOURLY_WAGE,
             default=0,
@@ -79,6 +206,9 @@ async def config_options_dict(handler: SchemaCommonFlowHandler) -> dict:
                 unit_of_measurement=handler.parent_handler.hass.config.currency,
             )()
         ),
+        vol.Optional(
+            CONF_TAX_TABLE,
+        ): TextSelector(),
         vol.Required(
             CONF_FLEX_HOURS,
             default=0,
@@ -100,15 +230,43 @@ async def config_options_dict(handler: SchemaCommonFlowHandler) -> dict:
             CONF_AUTO_RESET_FLEX_HOURS,
             default=True,
         ): BooleanSelector(),
+        vol.Required(
+            CONF_ROTATION_WEEKS,
+            default=1,
+        ): NumberSelector(
+            await NumberSelectorConfigTranslate(
+                handler.parent_handler.hass,
+                min=1,
+                max=ROTATION_MAX_WEEKS,
+                step=1,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="weeks",
+            )()
+        ),
+        vol.Optional(
+            CONF_ROTATION_START,
+        ): DateSelector(),
+        vol.Optional(
+            CONF_CALENDAR_ENTITY,
+        ): EntitySelector(EntitySelectorConfig(domain="calendar")),
+        vol.Optional(
+            CONF_PRESENCE_ENTITY,
+        ): EntitySelector(
+            EntitySelectorConfig(
+                domain=["binary_sensor", "input_boolean", "person", "switch"]
+            )
+        ),
     }
 
 
 # ------------------------------------------------------------------
-async def config_options_work_days_dict(handler: SchemaCommonFlowHandler) -> dict:
-    """Return dict for the work days options step."""
+async def config_options_work_days_dict(
+    handler: SchemaCommonFlowHandler, week: int = 1
+) -> dict:
+    """Return dict for the work days options step of a week."""
     tmp_dict: dict = {
         vol.Required(
-            CONF_WORK_HOURS + str(i),
+            work_day_key(CONF_WORK_HOURS, i, week),
             default=7.5,
         ): NumberSelector(
             await NumberSelectorConfigTranslate(
@@ -128,7 +286,7 @@ async def config_options_work_days_dict(handler: SchemaCommonFlowHandler) -> dic
     tmp_dict.update(
         {
             vol.Required(
-                CONF_WORK_HOURS + str(i),
+                work_day_key(CONF_WORK_HOURS, i, week),
                 default=0.0,
             ): NumberSelector(
                 await NumberSelectorConfigTranslate(
@@ -150,12 +308,14 @@ async def config_options_work_days_dict(handler: SchemaCommonFlowHandler) -> dic
 
 
 # ------------------------------------------------------------------
-async def config_options_work_starts_dict(handler: SchemaCommonFlowHandler) -> dict:
-    """Return dict for the work starts step."""
+async def config_options_work_starts_dict(
+    handler: SchemaCommonFlowHandler, week: int = 1
+) -> dict:
+    """Return dict for the work starts step of a week."""
 
     tmp_dict: dict = {
         vol.Required(
-            CONF_WORK_STARTS + str(i),
+            work_day_key(CONF_WORK_STARTS, i, week),
             default="08:00:00",
         ): TimeSelector()
         for i in DayOfWeekEnum.range(
@@ -166,7 +326,7 @@ async def config_options_work_starts_dict(handler: SchemaCommonFlowHandler) -> d
     tmp_dict.update(
         {
             vol.Required(
-                CONF_WORK_STARTS + str(i),
+                work_day_key(CONF_WORK_STARTS, i, week),
                 default="00:00:00",
             ): TimeSelector()
             for i in DayOfWeekEnum.range(
@@ -187,20 +347,20 @@ async def config_options_schema(handler: SchemaCommonFlowHandler) -> vol.Schema:
 
 # ------------------------------------------------------------------
 async def config_options_work_days_schema(
-    handler: SchemaCommonFlowHandler,
+    handler: SchemaCommonFlowHandler, week: int = 1
 ) -> vol.Schema:
-    """Return schema for the work days options step."""
+    """Return schema for the work days options step of a week."""
 
-    return vol.Schema(await config_options_work_days_dict(handler))
+    return vol.Schema(await config_options_work_days_dict(handler, week))
 
 
 # ------------------------------------------------------------------
 async def config_options_work_starts_schema(
-    handler: SchemaCommonFlowHandler,
+    handler: SchemaCommonFlowHandler, week: int = 1
 ) -> vol.Schema:
-    """Return schema for the work starts options step."""
+    """Return schema for the work starts options step of a week."""
 
-    return vol.Schema(await config_options_work_starts_dict(handler))
+    return vol.Schema(await config_options_work_starts_dict(handler, week))
 
 
 # ------------------------------------------------------------------
@@ -215,28 +375,78 @@ async def config_schema(handler: SchemaCommonFlowHandler) -> vol.Schema:
 
 
 # ------------------------------------------------------------------
-async def next_weekly_work_starts_at_config_step(options: dict[str, Any]) -> str | None:
-    """Return next step_id for config flow."""
+def week_step_id(step: str, week: int) -> str:
+    """Return step_id of a step for a week of the rotation."""
+
+    if week == 1:
+        return step
+
+    return f"{step}_{week}"
+
+
+# ------------------------------------------------------------------
+def rotation_weeks(options: dict[str, Any]) -> int:
+    """Return number of weeks in the rotation."""
+
+    return int(options.get(CONF_ROTATION_WEEKS, 1))
+
+
+# ------------------------------------------------------------------
+def work_days_next_step(
+    prefix: str, week: int
+) -> Callable[[dict[str, Any]], Coroutine[Any, Any, str | None]]:
+    """Return next step function after the work days step of a week.
+
+    The work days of all weeks are entered before the work starts.
+    """
 
-    if options[CONF_UPDATE_CONTINUOUSLY]:
-        return "user_work_starts"
+    async def next_step(options: dict[str, Any]) -> str | None:
+        if week < rotation_weeks(options):
+            return week_step_id(f"{prefix}_work_days", week + 1)
 
-    return None
+        if options[CONF_UPDATE_CONTINUOUSLY]:
+            return f"{prefix}_work_starts"
+
+        return None
+
+    return next_step
 
 
 # ------------------------------------------------------------------
-async def next_weekly_work_starts_at_options_step(
-    options: dict[str, Any],
-) -> str | None:
-    """Return next step_id for options flow."""
+def work_starts_next_step(
+    prefix: str, week: int
+) -> Callable[[dict[str, Any]], Coroutine[Any, Any, str | None]]:
+    """Return next step function after the work starts step of a week."""
+
+    async def next_step(options: dict[str, Any]) -> str | None:
+        if week < rotation_weeks(options):
+            return week_step_id(f"{prefix}_work_starts", week + 1)
 
-    if options[CONF_UPDATE_CONTINUOUSLY]:
-        return "init_work_starts"
+        return None
 
-    return None
+    return next_step
 
 
 # ------------------------------------------------------------------
+def work_week_steps(prefix: str) -> dict[str, SchemaFlowFormStep]:
+    """Return work days and work starts steps for all weeks of a rotation."""
+
+    tmp_steps: dict[str, SchemaFlowFormStep] = {}
+
+    for week in range(1, ROTATION_MAX_WEEKS + 1):
+        tmp_steps[week_step_id(f"{prefix}_work_days", week)] = SchemaFlowFormStep(
+            partial(config_options_work_days_schema, week=week),
+            validate_user_input=_validate_input,
+            next_step=work_days_next_step(prefix, week),
+        )
+        tmp_steps[week_step_id(f"{prefix}_work_starts", week)] = SchemaFlowFormStep(
+            partial(config_options_work_starts_schema, week=week),
+            validate_user_input=_validate_input,
+            next_step=work_starts_next_step(prefix, week),
+        )
+
+    return tmp_steps
+
 
 CONFIG_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
     "user": SchemaFlowFormStep(
@@ -244,15 +454,7 @@ CONFIG_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
         validate_user_input=_validate_input,
         next_step="user_work_days",
     ),
-    "user_work_days": SchemaFlowFormStep(
-        config_options_work_days_schema,
-        validate_user_input=_validate_input,
-        next_step=next_weekly_work_starts_at_config_step,
-    ),
-    "user_work_starts": SchemaFlowFormStep(
-        config_options_work_starts_schema,
-        validate_user_input=_validate_input,
-    ),
+    **work_week_steps("user"),
 }
 
 OPTIONS_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
@@ -261,15 +463,7 @@ OPTIONS_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
         validate_user_input=_validate_input,
         next_step="init_work_days",
     ),
-    "init_work_days": SchemaFlowFormStep(
-        config_options_work_days_schema,
-        validate_user_input=_validate_input,
-        next_step=next_weekly_work_starts_at_options_step,
-    ),
-    "init_work_starts": SchemaFlowFormStep(
-        config_options_work_starts_schema,
-        validate_user_input=_validate_input,
-    ),
+    **work_week_steps("init"),
 }
 
 
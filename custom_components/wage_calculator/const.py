@@ -1,6 +1,8 @@
 """Constants for the Wage calculator integration."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
+import re
 
 from .hass_util import EnumExt
 
@@ -11,6 +13,40 @@ LOGGER: Logger = getLogger(__name__)
 
 TRANSLATION_KEY = DOMAIN
 
+SIGNAL_ENTRY_LOADED = f"{DOMAIN}_entry_loaded_{{}}"
+SIGNAL_ENTRY_UNLOADED = f"{DOMAIN}_entry_unloaded_{{}}"
+SIGNAL_ENTRY_REMOVED = f"{DOMAIN}_entry_removed_{{}}"
+
+UPDATE_INTERVAL = timedelta(minutes=15)
+UPDATE_MAX_INTERVAL = timedelta(hours=1)
+UPDATE_MAX_JITTER = timedelta(seconds=20)
+UPDATE_LAG_HIGH = 0.5
+UPDATE_LAG_LOW = 0.1
+FLEX_HOURS_SAVE_DELAY = timedelta(seconds=30)
+DATE_OVERRIDES_SAVE_DELAY = timedelta(seconds=30)
+FLEX_LEDGER_KEEP_MONTHS = 3
+FLEX_HISTORY_MAX_DAYS = 3660
+HOLIDAY_DATASET_YEARS_BACK = 2
+HOLIDAY_DATASET_YEARS_AHEAD = 5
+HOLIDAY_PREFETCH_MONTH = 12
+DAY_RECORDS_CHUNK_DAYS = 100
+CALENDAR_CACHED_WINDOWS = 8
+EXPORT_MAX_DAYS = 3660
+EXPORT_CHUNK_ROWS = 200
+DATE_OVERRIDES_MAX_DAYS = 366
+ROTATION_MAX_WEEKS = 4
+SIMULATION_MAX_WORKERS = 4
+SIMULATION_MAX_SCHEDULES = 20
+SIMULATION_MAX_DAYS = 3660
+SIMULATION_MAX_MONTH_ROWS = 600
+SIMULATION_TIMEOUT = timedelta(seconds=60)
+SIMULATION_IDLE_TIMEOUT = timedelta(minutes=5)
+WEBSOCKET_RELOAD_TIMEOUT = timedelta(seconds=60)
+
+HOLIDAY_SOURCE_PATTERN = re.compile(r"[A-Z]{2,3}(-[A-Z0-9]{1,6})?")
+TAX_TABLE_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+TAX_TABLES_DIR = "tax_tables"
+
 CONF_HOURLY_WAGE = "hourly_wage"
 CONF_FLEX_HOURS = "flex_hours"
 CONF_UPDATE_CONTINUOUSLY = "update_continuously"
@@ -18,6 +54,22 @@ CONF_AUTO_RESET_FLEX_HOURS = "auto_reset_flex_hours"
 CONF_RESET_FLEX_DATE = "last_updated"
 CONF_WORK_HOURS = "work_hours_"
 CONF_WORK_STARTS = "work_starts_"
+CONF_CALENDAR_ENTITY = "calendar_entity"
+CONF_PRESENCE_ENTITY = "presence_entity"
+CONF_SUBDIVISION = "subdivision"
+CONF_HOLIDAY_SOURCES = "holiday_sources"
+CONF_HOLIDAY_COMBINE = "holiday_combine"
+CONF_INCLUDE_DATES = "include_dates"
+CONF_EXCLUDE_DATES = "exclude_dates"
+CONF_START_DATE = "start_date"
+CONF_END_DATE = "end_date"
+CONF_HOURS = "hours"
+CONF_ROTATION_WEEKS = "rotation_weeks"
+CONF_ROTATION_START = "rotation_start"
+CONF_SCHEDULES = "schedules"
+CONF_SCHEDULE_WORK_HOURS = "work_hours"
+CONF_MONTHLY = "monthly"
+CONF_TAX_TABLE = "tax_table"
 
 
 class DayOfWeekEnum(EnumExt):
@@ -30,3 +82,23 @@ class DayOfWeekEnum(EnumExt):
     FRIDAY = "fri"
     SATURDAY = "sat"
     SUNDAY = "sun"
+
+
+class HolidayCombineEnum(EnumExt):
+    """HolidayCombineEnum."""
+
+    UNION = "union"
+    INTERSECTION = "intersection"
+
+
+# ------------------------------------------------------------------
+def work_day_key(prefix: str, day: DayOfWeekEnum, week: int = 1) -> str:
+    """Option key of a day in a week of the rotation.
+
+    The first week keeps the keys from before rotations.
+    """
+
+    if week == 1:
+        return prefix + str(day)
+
+    return f"{prefix}{day}_{week}"
@@ -0,0 +1,81 @@
+"""Date overrides."""
+
+from datetime import date
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATE_OVERRIDES_SAVE_DELAY, DOMAIN
+from .hass_util import StorageJson
+
+
+# ------------------------------------------------------------------
+def date_overrides_key(entry_id: str) -> str:
+    """Storage key of the date overrides of an entry."""
+
+    return f"{DOMAIN}.{entry_id}.date_overrides"
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class DateOverrides:
+    """Table of dates with replacement work minutes.
+
+    Used for company closures, swapped work days and one-off extra shifts.
+    The table is stored outside the config entry, so edits do not reload the
+    entry.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.storage: StorageJson = StorageJson(hass, date_overrides_key(entry_id))
+
+        self.days: dict[date, int] = {}
+        self._save_pending: bool = False
+
+    # ------------------------------------------------------------------
+    async def async_load(self) -> None:
+        """Load overrides."""
+
+        tmp_data: dict | None = await self.storage.async_read_settings()
+
+        if tmp_data is None:
+            return
+
+        self.days.update(
+            {date.fromisoformat(day): minutes for day, minutes in tmp_data.items()}
+        )
+
+    # ------------------------------------------------------------------
+    def set(self, days: list[date], minutes: int | None) -> None:
+        """Set work minutes of days, None removes the overrides."""
+
+        for day in days:
+            if minutes is None:
+                self.days.pop(day, None)
+            else:
+                self.days[day] = minutes
+
+        self._save_pending = True
+        self.storage.async_delay_write_settings(
+            self._data_to_save, DATE_OVERRIDES_SAVE_DELAY.total_seconds()
+        )
+
+    # ------------------------------------------------------------------
+    def _data_to_save(self) -> dict:
+        """Data to save."""
+
+        self._save_pending = False
+        return {day.isoformat(): minutes for day, minutes in sorted(self.days.items())}
+
+    # ------------------------------------------------------------------
+    async def async_flush(self) -> None:
+        """Write a pending delayed save now, called on unload."""
+
+        if self._save_pending:
+            await self.storage.async_write_settings(self._data_to_save())
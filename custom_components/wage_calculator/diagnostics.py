@@ -0,0 +1,33 @@
+"""Diagnostics support for Wage calculator."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import CommonConfigEntry
+from .domain_data import async_get_domain_data
+from .ticker import WageTicker
+
+
+# ------------------------------------------------------------------
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: CommonConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    tmp_ticker: WageTicker = async_get_domain_data(hass).ticker
+
+    return {
+        "options": dict(entry.options),
+        "refresh": {
+            "interval": tmp_ticker.interval.total_seconds(),
+            "effective_interval": tmp_ticker.effective_interval.total_seconds(),
+            "max_interval": tmp_ticker.max_interval.total_seconds(),
+            "max_jitter": tmp_ticker.max_jitter.total_seconds(),
+            "jitter": tmp_ticker.jitters[entry.entry_id].total_seconds(),
+            "loop_lag": tmp_ticker.loop_lag,
+        },
+        "wage": str(entry.runtime_data.component_api.calc_monthly_wage),
+    }
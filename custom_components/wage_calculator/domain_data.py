@@ -0,0 +1,36 @@
+"""Data shared by all entries of the integration."""
+
+from dataclasses import dataclass
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .holiday_provider import HolidayProvider
+from .simulation import WageSimulator
+from .ticker import WageTicker
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class DomainData:
+    """Domain data."""
+
+    holiday_provider: HolidayProvider
+    ticker: WageTicker
+    simulator: WageSimulator
+
+
+# ------------------------------------------------------------------
+@callback
+def async_get_domain_data(hass: HomeAssistant) -> DomainData:
+    """Get data shared by all entries, created on first use."""
+
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = DomainData(
+            holiday_provider=HolidayProvider(hass),
+            ticker=WageTicker(hass),
+            simulator=WageSimulator(hass),
+        )
+
+    return hass.data[DOMAIN]
@@ -0,0 +1,171 @@
+"""Flex hours ledger."""
+
+from bisect import bisect_right, insort
+from datetime import date
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, FLEX_HOURS_SAVE_DELAY, FLEX_LEDGER_KEEP_MONTHS
+from .hass_util import StorageJson
+
+
+# ------------------------------------------------------------------
+def flex_ledger_key(entry_id: str) -> str:
+    """Storage key of the flex hours ledger of an entry."""
+
+    return f"{DOMAIN}.{entry_id}.flex_ledger"
+
+
+# ------------------------------------------------------------------
+def month_key(day: date) -> str:
+    """Month key of a date."""
+
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class FlexLedger:
+    """Append-only ledger of flex hour adjustments.
+
+    Each adjustment is stored with timestamp, minutes and source. The net
+    adjustment and closing balance per month are materialized, and adjustments
+    of older months are compacted into monthly snapshots.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.storage: StorageJson = StorageJson(hass, flex_ledger_key(entry_id))
+
+        self.entries: list[list] = []
+        self.snapshots: dict[str, list[int]] = {}
+        self.balance: int = 0
+
+        self._save_pending: bool = False
+
+        self._months: list[str] = []
+        self._month_net: dict[str, int] = {}
+        self._month_balance: dict[str, int] = {}
+        self._month_count: dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    async def async_load(self) -> None:
+        """Load ledger and materialize month values."""
+
+        tmp_data: dict | None = await self.storage.async_read_settings()
+
+        if tmp_data is None:
+            return
+
+        self.snapshots = tmp_data.get("snapshots", {})
+        self.entries = tmp_data.get("entries", [])
+
+        for key, (net, balance, count) in sorted(self.snapshots.items()):
+            self._months.append(key)
+            self._month_net[key] = net
+            self._month_balance[key] = balance
+            self._month_count[key] = count
+            self.balance = balance
+
+        for timestamp, minutes, _source in self.entries:
+            self._apply(timestamp[0:7], minutes)
+
+        self.compact()
+
+    # ------------------------------------------------------------------
+    def _apply(self, key: str, minutes: int) -> None:
+        """Apply adjustment to the materialized month values."""
+
+        if key not in self._month_net:
+            insort(self._months, key)
+            self._month_net[key] = 0
+            self._month_count[key] = 0
+
+        self.balance += minutes
+        self._month_net[key] += minutes
+        self._month_count[key] += 1
+        self._month_balance[key] = self.balance
+
+    # ------------------------------------------------------------------
+    def append(self, minutes: int, source: str) -> None:
+        """Append adjustment and schedule write of the ledger."""
+
+        if minutes == 0:
+            return
+
+        tmp_timestamp: str = dt_util.now().isoformat()
+        self.entries.append([tmp_timestamp, minutes, source])
+        self._apply(tmp_timestamp[0:7], minutes)
+        self.compact()
+
+        self._save_pending = True
+        self.storage.async_delay_write_settings(
+            self._data_to_save, FLEX_HOURS_SAVE_DELAY.total_seconds()
+        )
+
+    # ------------------------------------------------------------------
+    def _data_to_save(self) -> dict:
+        """Data to save."""
+
+        self._save_pending = False
+        return {"snapshots": self.snapshots, "entries": self.entries}
+
+    # ------------------------------------------------------------------
+    async def async_flush(self) -> None:
+        """Write a pending delayed save now.
+
+        Called on unload, so a delayed save does not recreate the file after
+        the entry is removed.
+        """
+
+        if self._save_pending:
+            await self.storage.async_write_settings(self._data_to_save())
+
+    # ------------------------------------------------------------------
+    def compact(self) -> None:
+        """Compact adjustments of old months into monthly snapshots."""
+
+        tmp_today: date = dt_util.now().date()
+        tmp_month: int = tmp_today.year * 12 + tmp_today.month - FLEX_LEDGER_KEEP_MONTHS
+        tmp_cutoff: str = month_key(date(tmp_month // 12, tmp_month % 12 + 1, 1))
+
+        if len(self.entries) == 0 or self.entries[0][0][0:7] >= tmp_cutoff:
+            return
+
+        for key in {
+            entry[0][0:7] for entry in self.entries if entry[0][0:7] < tmp_cutoff
+        }:
+            self.snapshots[key] = [
+                self._month_net[key],
+                self._month_balance[key],
+                self._month_count[key],
+            ]
+
+        self.entries = [entry for entry in self.entries if entry[0][0:7] >= tmp_cutoff]
+
+    # ------------------------------------------------------------------
+    def month_net(self, year: int, month: int) -> int:
+        """Net adjustment in minutes of a month."""
+
+        return self._month_net.get(month_key(date(year, month, 1)), 0)
+
+    # ------------------------------------------------------------------
+    def month_balance(self, year: int, month: int) -> int:
+        """Balance in minutes at the end of a month."""
+
+        tmp_key: str = month_key(date(year, month, 1))
+
+        if (tmp_balance := self._month_balance.get(tmp_key)) is not None:
+            return tmp_balance
+
+        if (tmp_index := bisect_right(self._months, tmp_key)) == 0:
+            return 0
+
+        return self._month_balance[self._months[tmp_index - 1]]
@@ -6,6 +6,7 @@ It includes functions for handling retries, managing timers, and translating tex
 External imports:
     handle_retries: None
     storage_json: jsonpickle
+    timer_scheduler: None
     timer_trigger: None
     translate: aiofiles, orjson
 """
@@ -30,6 +31,7 @@ from .hass_util import (
 )
 from .json_ext import DictToObject, JsonExt
 from .storage_json import StorageJson, StoreMigrate
+from .timer_scheduler import TimerScheduler
 from .timer_trigger import TimerTrigger, TimerTriggerErrorEnum
 from .translate import NumberSelectorConfigTranslate, Translate
 
@@ -45,6 +47,7 @@ __all__ = [
     "RetryStopException",
     "StorageJson",
     "StoreMigrate",
+    "TimerScheduler",
     "TimerTrigger",
     "TimerTriggerErrorEnum",
     "Translate",
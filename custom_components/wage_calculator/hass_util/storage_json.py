@@ -9,7 +9,7 @@ from typing import Any
 
 import jsonpickle
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
 
@@ -121,6 +121,28 @@ class StorageJson:
                 {self.DICT_KEY___: self.encode_data(self), **extra_data}
             )
 
+    # ------------------------------------------------------------------
+    @callback
+    def async_delay_write_settings(
+        self, extra_data_func: Callable[[], dict] = dict, delay: float = 0
+    ) -> None:
+        """Write settings after a delay.
+
+        A pending delayed write is replaced, and pending writes are flushed
+        when Home Assistant stops.
+        """
+
+        jsonpickle.set_encoder_options("json", ensure_ascii=False)
+
+        if self.base_class___:
+            self.store___.async_delay_save(extra_data_func, delay)
+
+        else:
+            self.store___.async_delay_save(
+                lambda: {self.DICT_KEY___: self.encode_data(self), **extra_data_func()},
+                delay,
+            )
+
     # ------------------------------------------------------------------
     def encode_data(self, data: Any):
         """Encode data."""
@@ -0,0 +1,206 @@
+"""Timer scheduler.
+
+External imports: None
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import heapq
+from itertools import count
+from typing import Any
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+_DATA_KEY = f"{__name__}.TimerScheduler"
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class TimerScheduler:
+    """Timer scheduler shared by all users in an integration.
+
+    Pending actions are kept in a heap behind a single point in time listener,
+    and one timer.finished listener dispatches to actions by timer entity id.
+    Cancelled actions drop their job at once and are removed from the heap
+    when they reach the head, or when they make up most of the heap.
+
+    External imports: None
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+
+        self._heap: list[list] = []
+        self._seq = count()
+        self._cancelled: int = 0
+        self._armed_at: datetime | None = None
+        self._unsub_point_in_time: CALLBACK_TYPE | None = None
+
+        self._timer_actions: dict[str, list[HassJob]] = {}
+        self._unsub_timer_finished: CALLBACK_TYPE | None = None
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    @callback
+    def async_get(hass: HomeAssistant) -> TimerScheduler:
+        """Get the scheduler, created on first use."""
+
+        if _DATA_KEY not in hass.data:
+            hass.data[_DATA_KEY] = TimerScheduler(hass)
+
+        return hass.data[_DATA_KEY]
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def align_time(when: datetime, align: timedelta | None) -> datetime:
+        """Round time up to the next multiple of align."""
+
+        if align is None or align.total_seconds() <= 0:
+            return when
+
+        tmp_align: float = align.total_seconds()
+        tmp_timestamp: float = when.timestamp()
+        tmp_remainder: float = tmp_timestamp % tmp_align
+
+        if tmp_remainder == 0:
+            return when
+
+        return dt_util.utc_from_timestamp(tmp_timestamp - tmp_remainder + tmp_align)
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_schedule(
+        self,
+        when: datetime,
+        action: Callable[[datetime], Any],
+        align: timedelta | None = None,
+    ) -> CALLBACK_TYPE:
+        """Schedule action at a point in time, returns function to cancel it.
+
+        With align the time is rounded up to the next multiple of align, so
+        actions scheduled close to each other fires together.
+        """
+
+        tmp_when: datetime = dt_util.as_utc(self.align_time(when, align))
+        tmp_item: list = [tmp_when, next(self._seq), HassJob(action)]
+        heapq.heappush(self._heap, tmp_item)
+        self._async_arm()
+
+        # ------------------------------------------------------------------
+        @callback
+        def async_cancel() -> None:
+            if tmp_item[2] is None:
+                return
+
+            tmp_item[2] = None
+            self._cancelled += 1
+
+            if self._cancelled > len(self._heap) // 2:
+                self._async_compact()
+
+        return async_cancel
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_compact(self) -> None:
+        """Remove all cancelled actions from the heap."""
+
+        self._heap = [item for item in self._heap if item[2] is not None]
+        heapq.heapify(self._heap)
+        self._cancelled = 0
+        self._async_arm()
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_arm(self) -> None:
+        """Arm point in time listener for the first pending action."""
+
+        while self._heap and self._heap[0][2] is None:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+
+        if not self._heap:
+            if self._unsub_point_in_time is not None:
+                self._unsub_point_in_time()
+                self._unsub_point_in_time = None
+                self._armed_at = None
+            return
+
+        if self._armed_at is not None and self._armed_at <= self._heap[0][0]:
+            return
+
+        if self._unsub_point_in_time is not None:
+            self._unsub_point_in_time()
+
+        self._armed_at = self._heap[0][0]
+        self._unsub_point_in_time = async_track_point_in_utc_time(
+            self.hass, self._async_fire, self._armed_at
+        )
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Run all due actions and arm for the next."""
+
+        self._unsub_point_in_time = None
+        self._armed_at = None
+        tmp_now: datetime = max(now, dt_util.utcnow())
+
+        while self._heap and self._heap[0][0] <= tmp_now:
+            tmp_item: list = heapq.heappop(self._heap)
+
+            if (job := tmp_item[2]) is None:
+                self._cancelled -= 1
+                continue
+
+            tmp_item[2] = None
+            self.hass.async_run_hass_job(job, tmp_item[0])
+
+        self._async_arm()
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_listen_timer_finished(
+        self, timer_entity: str, action: Callable[[Event], Any]
+    ) -> CALLBACK_TYPE:
+        """Listen for timer.finished of a timer entity.
+
+        Returns function to stop listening.
+        """
+
+        tmp_job: HassJob = HassJob(action)
+        self._timer_actions.setdefault(timer_entity, []).append(tmp_job)
+
+        if self._unsub_timer_finished is None:
+            self._unsub_timer_finished = self.hass.bus.async_listen(
+                "timer.finished", self._async_timer_finished
+            )
+
+        # ------------------------------------------------------------------
+        @callback
+        def async_remove() -> None:
+            self._timer_actions[timer_entity].remove(tmp_job)
+
+            if len(self._timer_actions[timer_entity]) == 0:
+                del self._timer_actions[timer_entity]
+
+            if len(self._timer_actions) == 0 and self._unsub_timer_finished:
+                self._unsub_timer_finished()
+                self._unsub_timer_finished = None
+
+        return async_remove
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_timer_finished(self, event: Event) -> None:
+        """Dispatch timer.finished to the actions of the timer entity."""
+
+        for job in list(self._timer_actions.get(event.data.get(ATTR_ENTITY_ID), [])):
+            self.hass.async_run_hass_job(job, event)
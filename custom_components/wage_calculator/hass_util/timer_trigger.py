@@ -11,9 +11,10 @@ from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import Event, State, callback
 from homeassistant.helpers import start
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import Callable, dt as dt_util
 
+from .timer_scheduler import TimerScheduler
+
 # ------------------------------------------------------
 # ------------------------------------------------------
 
@@ -50,8 +51,13 @@ class TimerTrigger:
         duration: timedelta | None = None,
         callback_trigger: Callable[[TimerTriggerErrorEnum], None] = None,
         auto_restart: bool = True,
+        align: timedelta | None = None,
     ) -> None:
-        """Init."""
+        """Init.
+
+        With align and duration the trigger times are rounded up to the next
+        multiple of align, so triggers with close times fires together.
+        """
 
         if (timer_entity == "" and duration is None) or (
             timer_entity == ""
@@ -70,10 +76,12 @@ class TimerTrigger:
             callback_trigger
         )
         self.auto_restart: bool = auto_restart
+        self.align: timedelta | None = align
 
         self.error: TimerTriggerErrorEnum = TimerTriggerErrorEnum.NONE
         self.timer_state: State
         self.unsub_async_track_point_in_utc_time: Callable[[], None] | None = None
+        self.scheduler: TimerScheduler = TimerScheduler.async_get(self.entity.hass)
 
         self.entity.async_on_remove(
             start.async_at_started(self.entity.hass, self.async_hass_started)
@@ -146,23 +154,22 @@ class TimerTrigger:
 
         if self.error:
             return
-        self.unsub_async_track_point_in_utc_time = async_track_point_in_utc_time(
-            self.entity.hass,
-            self.async_point_in_time_listener,
+        self.unsub_async_track_point_in_utc_time = self.scheduler.async_schedule(
             dt_util.utcnow() + self.duration,
+            self.async_point_in_time_listener,
+            self.align,
         )
 
     # ------------------------------------------------------------------
-    @callback
     async def async_handle_timer_finished(self, event: Event) -> None:
-        """Handle timer finished."""
+        """Handle timer finished, only called for the timer entity."""
 
         if inspect.iscoroutinefunction(self.callback_trigger):
             await self.callback_trigger(self.error)
         else:
             self.callback_trigger(self.error)
 
-        if not self.error and event.data[ATTR_ENTITY_ID] == self.timer_entity:
+        if not self.error:
             if self.auto_restart:
                 if await self.async_validate_timer():
                     await self.async_restart_timer()
@@ -174,8 +181,8 @@ class TimerTrigger:
         if self.timer_entity != "":
             if await self.async_validate_timer():
                 self.entity.async_on_remove(
-                    self.entity.hass.bus.async_listen(
-                        "timer.finished", self.async_handle_timer_finished
+                    self.scheduler.async_listen_timer_finished(
+                        self.timer_entity, self.async_handle_timer_finished
                     )
                 )
 
@@ -185,10 +192,10 @@ class TimerTrigger:
         else:
             self.entity.async_on_remove(self.async_remove_from_hass)
 
-            self.unsub_async_track_point_in_utc_time = async_track_point_in_utc_time(
-                self.entity.hass,
-                self.async_point_in_time_listener,
+            self.unsub_async_track_point_in_utc_time = self.scheduler.async_schedule(
                 dt_util.utcnow() + self.duration,
+                self.async_point_in_time_listener,
+                self.align,
             )
 
     # ------------------------------------------------------
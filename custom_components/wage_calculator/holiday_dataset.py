@@ -0,0 +1,252 @@
+"""Compiled holiday dataset.
+
+Holidays of a country are compiled once into a binary file of sorted date
+ordinals, which is memory mapped at runtime. Years outside the file are
+generated with the holidays package when first needed.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import date
+import mmap
+import os
+from pathlib import Path
+import struct
+
+# Magic, first year, last year, holiday count, names size, holidays version
+HEADER = struct.Struct("<4sHHII16s")
+MAGIC = b"WCH1"
+
+
+# ------------------------------------------------------------------
+def split_holiday_source(source: str) -> tuple[str, str | None]:
+    """Split a holiday source like DE-BY into country and subdivision."""
+
+    tmp_country, _, tmp_subdivision = source.partition("-")
+    return tmp_country, tmp_subdivision or None
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class HolidayYearNotLoadedError(LookupError):
+    """Holidays of a year are looked up before the year is loaded."""
+
+    def __init__(self, source: str, year: int) -> None:
+        """Init."""
+
+        super().__init__(f"Holidays of {source} for {year} are not loaded")
+        self.source: str = source
+        self.year: int = year
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class HolidayDataset:
+    """Memory mapped holiday dataset of a country."""
+
+    def __init__(self, data: mmap.mmap) -> None:
+        """Init."""
+
+        (
+            tmp_magic,
+            self.first_year,
+            self.last_year,
+            tmp_count,
+            tmp_names_size,
+            tmp_version,
+        ) = HEADER.unpack_from(data)
+
+        if tmp_magic != MAGIC:
+            raise ValueError("Not a holiday dataset")
+
+        self.version: str = tmp_version.rstrip(b"\0").decode()
+
+        tmp_view: memoryview = memoryview(data)
+        tmp_offset: int = HEADER.size
+        self.ordinals: memoryview = tmp_view[
+            tmp_offset : tmp_offset + tmp_count * 4
+        ].cast("I")
+        tmp_offset += tmp_count * 4
+        self._name_ids: memoryview = tmp_view[
+            tmp_offset : tmp_offset + tmp_count * 2
+        ].cast("H")
+        tmp_offset += tmp_count * 2
+        self._names: list[str] = (
+            bytes(tmp_view[tmp_offset : tmp_offset + tmp_names_size])
+            .decode()
+            .split("\n")
+        )
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def open(path: Path) -> HolidayDataset | None:
+        """Open and memory map a dataset, None if missing or invalid.
+
+        Blocking, must be run in the executor.
+        """
+
+        try:
+            with path.open("rb") as file:
+                return HolidayDataset(
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                )
+        except (OSError, ValueError, struct.error):
+            return None
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def compile(
+        path: Path, holidays: dict[date, str], years: range, version: str
+    ) -> None:
+        """Compile holidays of years into a dataset file.
+
+        Blocking, must be run in the executor.
+        """
+
+        tmp_days: list[date] = sorted(holidays)
+        tmp_names: list[str] = sorted({holidays[day] for day in tmp_days})
+        tmp_name_ids: dict[str, int] = {name: i for i, name in enumerate(tmp_names)}
+        tmp_names_blob: bytes = "\n".join(tmp_names).encode()
+
+        tmp_path: Path = path.with_suffix(".tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with tmp_path.open("wb") as file:
+            file.write(
+                HEADER.pack(
+                    MAGIC,
+                    years.start,
+                    years.stop - 1,
+                    len(tmp_days),
+                    len(tmp_names_blob),
+                    version.encode()[0:16],
+                )
+            )
+            file.write(
+                struct.pack(f"<{len(tmp_days)}I", *map(date.toordinal, tmp_days))
+            )
+            file.write(
+                struct.pack(
+                    f"<{len(tmp_days)}H",
+                    *(tmp_name_ids[holidays[day]] for day in tmp_days),
+                )
+            )
+            file.write(tmp_names_blob)
+
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------
+    def covers(self, year: int) -> bool:
+        """Check if the year is in the dataset."""
+
+        return self.first_year <= year <= self.last_year
+
+    # ------------------------------------------------------------------
+    def get(self, day: date) -> str | None:
+        """Name of the holiday on a day, None if not a holiday."""
+
+        tmp_ordinal: int = day.toordinal()
+        tmp_index: int = bisect_left(self.ordinals, tmp_ordinal)
+
+        if tmp_index < len(self.ordinals) and self.ordinals[tmp_index] == tmp_ordinal:
+            return self._names[self._name_ids[tmp_index]]
+
+        return None
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class CompiledHolidays:
+    """Holidays of a source from the compiled dataset.
+
+    The source is a country code, optionally followed by a dash and a
+    subdivision. Years outside the dataset are generated with the holidays
+    package by load_years, they are not generated on lookup. Looking up a
+    year not loaded raises HolidayYearNotLoadedError.
+    """
+
+    def __init__(self, source: str, dataset: HolidayDataset) -> None:
+        """Init."""
+
+        self.source: str = source
+        self.country, self.subdivision = split_holiday_source(source)
+        self.dataset: HolidayDataset = dataset
+        self.version: str = dataset.version
+        self.years: set[int] = set(range(dataset.first_year, dataset.last_year + 1))
+
+        self._fallback: dict[date, str] = {}
+        self._year_masks: dict[int, int] = {}
+
+    # ------------------------------------------------------------------
+    def load_years(self, years: range) -> None:
+        """Generate holidays of years outside the dataset.
+
+        Blocking, must be run in the executor.
+        """
+
+        if len(tmp_years := [year for year in years if year not in self.years]) == 0:
+            return
+
+        from holidays import country_holidays
+
+        # Replaced, not updated, as lookups can run in the event loop meanwhile
+        self._fallback = self._fallback | dict(
+            country_holidays(
+                self.country, subdiv=self.subdivision, years=tmp_years
+            ).items()
+        )
+        self.years = self.years | set(tmp_years)
+
+    # ------------------------------------------------------------------
+    def year_mask(self, year: int) -> int:
+        """Bitmap of the holidays of a loaded year, bit n is day n of the year."""
+
+        if (tmp_mask := self._year_masks.get(year)) is not None:
+            return tmp_mask
+
+        self._check_year(year)
+        tmp_first: int = date(year, 1, 1).toordinal()
+        tmp_mask = 0
+
+        if self.dataset.covers(year):
+            tmp_ordinals: memoryview = self.dataset.ordinals
+
+            for index in range(
+                bisect_left(tmp_ordinals, tmp_first),
+                bisect_left(tmp_ordinals, date(year + 1, 1, 1).toordinal()),
+            ):
+                tmp_mask |= 1 << (tmp_ordinals[index] - tmp_first)
+        else:
+            for day in self._fallback:
+                if day.year == year:
+                    tmp_mask |= 1 << (day.toordinal() - tmp_first)
+
+        self._year_masks[year] = tmp_mask
+        return tmp_mask
+
+    # ------------------------------------------------------------------
+    def _check_year(self, year: int) -> None:
+        """Raise if the holidays of a year are not loaded."""
+
+        if year not in self.years:
+            raise HolidayYearNotLoadedError(self.source, year)
+
+    # ------------------------------------------------------------------
+    def get(self, day: date, default: str | None = None) -> str | None:
+        """Name of the holiday on a day."""
+
+        self._check_year(day.year)
+
+        if self.dataset.covers(day.year):
+            tmp_name: str | None = self.dataset.get(day)
+        else:
+            tmp_name = self._fallback.get(day)
+
+        return default if tmp_name is None else tmp_name
+
+    # ------------------------------------------------------------------
+    def __contains__(self, day: date) -> bool:
+        """Check if a day is a holiday."""
+
+        return self.get(day) is not None
@@ -0,0 +1,158 @@
+"""Holiday provider."""
+
+from asyncio import Future, Lock
+from collections.abc import Callable
+from datetime import date, datetime
+from importlib.metadata import version
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    HOLIDAY_DATASET_YEARS_AHEAD,
+    HOLIDAY_DATASET_YEARS_BACK,
+    HOLIDAY_PREFETCH_MONTH,
+)
+from .hass_util import TimerScheduler
+from .holiday_dataset import CompiledHolidays, HolidayDataset, split_holiday_source
+from .holiday_set import HolidaySet
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class HolidayProvider:
+    """Holidays shared by all entries of the integration, one per source.
+
+    A source is a country, optionally with a subdivision like DE-BY.
+    Holidays are read from a memory mapped dataset per source, compiled on
+    first run and when the holidays package is updated. Years outside the
+    dataset are loaded in the executor, on demand and for the next year in
+    December, so they are never generated in the calculation.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self._holidays: dict[str, CompiledHolidays] = {}
+        self._lock: Lock = Lock()
+        self._loading: dict[str, Future[None]] = {}
+        self._prefetched_year: int = 0
+        self._unsub_prefetch: Callable[[], None] | None = None
+
+    # ------------------------------------------------------------------
+    async def async_get_holidays(self, source: str) -> CompiledHolidays:
+        """Get holidays for a source."""
+
+        async with self._lock:
+            if (tmp_holidays := self._holidays.get(source)) is None:
+                tmp_holidays = await self.hass.async_add_executor_job(
+                    self._open_holidays, source
+                )
+                self._holidays[source] = tmp_holidays
+
+            if self._unsub_prefetch is None:
+                self._async_schedule_prefetch()
+
+        return tmp_holidays
+
+    # ------------------------------------------------------------------
+    def _open_holidays(self, source: str) -> CompiledHolidays:
+        """Open the dataset of a source, compiled if missing or outdated."""
+
+        tmp_path: Path = Path(
+            self.hass.config.path(STORAGE_DIR, f"{DOMAIN}.holidays.{source}.bin")
+        )
+        tmp_version: str = version("holidays")
+        tmp_year: int = date.today().year
+
+        if (
+            (tmp_dataset := HolidayDataset.open(tmp_path)) is None
+            or tmp_dataset.version != tmp_version
+            or not tmp_dataset.covers(tmp_year + HOLIDAY_DATASET_YEARS_AHEAD - 1)
+        ):
+            from holidays import country_holidays
+
+            tmp_years: range = range(
+                tmp_year - HOLIDAY_DATASET_YEARS_BACK,
+                tmp_year + HOLIDAY_DATASET_YEARS_AHEAD + 1,
+            )
+            tmp_country, tmp_subdivision = split_holiday_source(source)
+            HolidayDataset.compile(
+                tmp_path,
+                dict(
+                    country_holidays(
+                        tmp_country, subdiv=tmp_subdivision, years=tmp_years
+                    ).items()
+                ),
+                tmp_years,
+                tmp_version,
+            )
+
+            if (tmp_dataset := HolidayDataset.open(tmp_path)) is None:
+                raise OSError(f"Unable to open holiday dataset {tmp_path}")
+
+        return CompiledHolidays(source, tmp_dataset)
+
+    # ------------------------------------------------------------------
+    async def async_load_years(
+        self, holidays: HolidaySet | CompiledHolidays, years: range
+    ) -> None:
+        """Load holidays of years outside the datasets in the executor.
+
+        Callers loading the same source awaits the load already running.
+        """
+
+        for source in (
+            holidays.sources if isinstance(holidays, HolidaySet) else [holidays]
+        ):
+            while not all(year in source.years for year in years):
+                if (tmp_loading := self._loading.get(source.source)) is not None:
+                    await tmp_loading
+                    continue
+
+                tmp_loading = self.hass.async_add_executor_job(source.load_years, years)
+                self._loading[source.source] = tmp_loading
+
+                try:
+                    await tmp_loading
+                finally:
+                    del self._loading[source.source]
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_schedule_prefetch(self) -> None:
+        """Schedule prefetch of the next year, right away if in the month."""
+
+        tmp_now: datetime = dt_util.now()
+        tmp_when: datetime = dt_util.start_of_local_day(
+            date(tmp_now.year, HOLIDAY_PREFETCH_MONTH, 1)
+        )
+
+        if tmp_when <= tmp_now and self._prefetched_year > tmp_now.year:
+            tmp_when = dt_util.start_of_local_day(
+                date(tmp_now.year + 1, HOLIDAY_PREFETCH_MONTH, 1)
+            )
+
+        self._unsub_prefetch = TimerScheduler.async_get(self.hass).async_schedule(
+            max(tmp_when, tmp_now), self._async_prefetch
+        )
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_prefetch(self, now: datetime) -> None:
+        """Prefetch holidays of the next year for all countries."""
+
+        self._prefetched_year = dt_util.as_local(now).year + 1
+        self._async_schedule_prefetch()
+
+        for holidays in self._holidays.values():
+            self.hass.async_create_background_task(
+                self.async_load_years(
+                    holidays, range(self._prefetched_year, self._prefetched_year + 1)
+                ),
+                f"{DOMAIN} prefetch holidays {holidays.source}",
+            )
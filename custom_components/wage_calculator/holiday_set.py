@@ -0,0 +1,134 @@
+"""Holiday set."""
+
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date
+from functools import reduce
+from operator import and_, or_
+
+from .holiday_dataset import CompiledHolidays
+
+
+# ------------------------------------------------------------------
+def iter_mask_days(
+    year_mask: Callable[[int], int], start: date, end: date
+) -> Iterator[date]:
+    """Days from start to end, both included, set in the bitmaps of the years."""
+
+    for year in range(start.year, end.year + 1):
+        tmp_first: int = date(year, 1, 1).toordinal()
+        tmp_mask: int = year_mask(year) >> max(start.toordinal() - tmp_first, 0)
+        tmp_ordinal: int = max(start.toordinal(), tmp_first)
+        tmp_stop: int = min(end.toordinal(), date(year, 12, 31).toordinal())
+
+        while tmp_mask:
+            tmp_lowest: int = (tmp_mask & -tmp_mask).bit_length() - 1
+            tmp_ordinal += tmp_lowest
+
+            if tmp_ordinal > tmp_stop:
+                break
+
+            yield date.fromordinal(tmp_ordinal)
+            tmp_mask >>= tmp_lowest + 1
+            tmp_ordinal += 1
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class HolidaySet:
+    """Holidays combined from one or more sources.
+
+    Per year the bitmaps of the sources are combined as a union or an
+    intersection, after which included dates are added and excluded dates
+    removed. Lookups are a bit test in the combined bitmap of the year.
+    """
+
+    def __init__(
+        self,
+        sources: list[CompiledHolidays],
+        intersection: bool = False,
+        include_dates: Iterable[date] = (),
+        exclude_dates: Iterable[date] = (),
+        include_name: str = "",
+    ) -> None:
+        """Init."""
+
+        self.sources: list[CompiledHolidays] = sources
+        self.intersection: bool = intersection
+        self.include_dates: set[date] = set(include_dates)
+        self.exclude_dates: set[date] = set(exclude_dates)
+        self.include_name: str = include_name
+
+        self.signature: str = repr(
+            (
+                [(source.source, source.version) for source in sources],
+                intersection,
+                sorted(self.include_dates),
+                sorted(self.exclude_dates),
+            )
+        )
+
+        self._year_masks: dict[int, int] = {}
+
+    # ------------------------------------------------------------------
+    @property
+    def years(self) -> set[int]:
+        """Years loaded in all sources."""
+
+        return set.intersection(*(source.years for source in self.sources))
+
+    # ------------------------------------------------------------------
+    def year_mask(self, year: int) -> int:
+        """Combined bitmap of a year, bit n is day n of the year.
+
+        Raises HolidayYearNotLoadedError if the year is not loaded in all
+        sources.
+        """
+
+        if (tmp_mask := self._year_masks.get(year)) is not None:
+            return tmp_mask
+
+        tmp_mask = reduce(
+            and_ if self.intersection else or_,
+            (source.year_mask(year) for source in self.sources),
+        )
+        tmp_first: int = date(year, 1, 1).toordinal()
+
+        for day in self.include_dates:
+            if day.year == year:
+                tmp_mask |= 1 << (day.toordinal() - tmp_first)
+
+        for day in self.exclude_dates:
+            if day.year == year:
+                tmp_mask &= ~(1 << (day.toordinal() - tmp_first))
+
+        self._year_masks[year] = tmp_mask
+        return tmp_mask
+
+    # ------------------------------------------------------------------
+    def days(self, start: date, end: date) -> Iterator[date]:
+        """Holidays from start to end, both included, from the set bits."""
+
+        return iter_mask_days(self.year_mask, start, end)
+
+    # ------------------------------------------------------------------
+    def __contains__(self, day: date) -> bool:
+        """Check if a day is a holiday."""
+
+        return bool(
+            self.year_mask(day.year)
+            >> (day.toordinal() - date(day.year, 1, 1).toordinal())
+            & 1
+        )
+
+    # ------------------------------------------------------------------
+    def get(self, day: date, default: str | None = None) -> str | None:
+        """Name of the holiday on a day."""
+
+        if day not in self:
+            return default
+
+        for source in self.sources:
+            if (tmp_name := source.get(day)) is not None:
+                return tmp_name
+
+        return self.include_name
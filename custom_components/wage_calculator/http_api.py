@@ -0,0 +1,168 @@
+"""Http api for Wage calculator."""
+
+from __future__ import annotations
+
+import csv
+from datetime import date
+from hashlib import sha1
+from http import HTTPStatus
+import io
+import json
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, EXPORT_CHUNK_ROWS, EXPORT_MAX_DAYS
+from .domain_data import async_get_domain_data
+from .wage_calc import DayRecord, WageCalc, minutes_to_hours
+
+EXPORT_FIELDS: list[str] = ["date", "weekday", "holiday", "hours", "earned"]
+EXPORT_FORMATS: dict[str, str] = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+
+
+# ------------------------------------------------------------------
+def _day_row(calc: WageCalc, record: DayRecord) -> dict[str, Any]:
+    """Day record converted for display."""
+
+    return {
+        "date": record.day.isoformat(),
+        "weekday": record.weekday,
+        "holiday": record.holiday,
+        "hours": minutes_to_hours(record.minutes),
+        "earned": calc.to_amount(record.earned_minor),
+    }
+
+
+# ------------------------------------------------------------------
+def _format_rows(rows: list[dict[str, Any]], fmt: str) -> bytes:
+    """Format rows as csv or json lines."""
+
+    if fmt == "jsonl":
+        return "".join(json.dumps(row) + "\n" for row in rows).encode()
+
+    tmp_buffer: io.StringIO = io.StringIO()
+    csv.DictWriter(tmp_buffer, EXPORT_FIELDS).writerows(rows)
+    return tmp_buffer.getvalue().encode()
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class WageExportView(HomeAssistantView):
+    """Export scheduled days, holidays, hours and earnings of an entry.
+
+    Query parameters are start and end as ISO dates, both included, and
+    format as csv or jsonl. Rows are generated and written in chunks, so
+    large periods are never held in memory.
+
+    Only an ETag from the hash of the inputs is sent, there is no stored
+    time of when the inputs changed to send as Last-Modified.
+    """
+
+    url = f"/api/{DOMAIN}/export/{{entry_id}}"
+    name = f"api:{DOMAIN}:export"
+    requires_auth = True
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _not_modified(request: web.Request, etag: str) -> bool:
+        """Check the If-None-Match header."""
+
+        if (tmp_if_none_match := request.headers.get("If-None-Match")) is None:
+            return False
+
+        return etag in tmp_if_none_match or tmp_if_none_match.strip() == "*"
+
+    # ------------------------------------------------------------------
+    async def get(self, request: web.Request, entry_id: str) -> web.StreamResponse:
+        """Stream the export."""
+
+        hass: HomeAssistant = request.app[KEY_HASS]
+
+        if (
+            (entry := hass.config_entries.async_get_entry(entry_id)) is None
+            or entry.domain != DOMAIN
+            or entry.state is not ConfigEntryState.LOADED
+        ):
+            return self.json_message("Entry not found", HTTPStatus.NOT_FOUND)
+
+        try:
+            tmp_start: date = date.fromisoformat(request.query["start"])
+            tmp_end: date = date.fromisoformat(request.query["end"])
+        except (KeyError, ValueError):
+            return self.json_message(
+                "start and end must be ISO dates", HTTPStatus.BAD_REQUEST
+            )
+
+        if not 0 <= (tmp_end - tmp_start).days < EXPORT_MAX_DAYS:
+            return self.json_message(
+                f"end must be after start and within {EXPORT_MAX_DAYS} days",
+                HTTPStatus.BAD_REQUEST,
+            )
+
+        if (tmp_format := request.query.get("format", "csv")) not in EXPORT_FORMATS:
+            return self.json_message(
+                f"format must be one of {', '.join(EXPORT_FORMATS)}",
+                HTTPStatus.BAD_REQUEST,
+            )
+
+        tmp_calc: WageCalc = entry.runtime_data.component_api.calc_monthly_wage
+        tmp_etag: str = (
+            '"'
+            + sha1(
+                repr(
+                    (tmp_calc.inputs_signature(), tmp_start, tmp_end, tmp_format)
+                ).encode(),
+                usedforsecurity=False,
+            ).hexdigest()
+            + '"'
+        )
+        tmp_headers: dict[str, str] = {
+            "ETag": tmp_etag,
+            "Cache-Control": "private, no-cache",
+        }
+
+        if self._not_modified(request, tmp_etag):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=tmp_headers)
+
+        # Holidays are loaded before the response is started, so a failure
+        # is an error response and not a truncated export
+        try:
+            await async_get_domain_data(hass).holiday_provider.async_load_years(
+                tmp_calc.holidays, range(tmp_start.year, tmp_end.year + 1)
+            )
+        except (NotImplementedError, OSError) as err:
+            return self.json_message(
+                f"Unable to load holidays: {err}", HTTPStatus.INTERNAL_SERVER_ERROR
+            )
+
+        response: web.StreamResponse = web.StreamResponse(headers=tmp_headers)
+        response.content_type = EXPORT_FORMATS[tmp_format]
+        response.headers["Content-Disposition"] = (
+            f'attachment; filename="{DOMAIN}_{tmp_start}_{tmp_end}.{tmp_format}"'
+        )
+        await response.prepare(request)
+
+        if tmp_format == "csv":
+            await response.write((",".join(EXPORT_FIELDS) + "\r\n").encode())
+
+        tmp_rows: list[dict[str, Any]] = []
+
+        async for record in tmp_calc.async_iter_days(tmp_start, tmp_end):
+            tmp_rows.append(_day_row(tmp_calc, record))
+
+            if len(tmp_rows) == EXPORT_CHUNK_ROWS:
+                await response.write(_format_rows(tmp_rows, tmp_format))
+                tmp_rows.clear()
+
+        if tmp_rows:
+            await response.write(_format_rows(tmp_rows, tmp_format))
+
+        await response.write_eof()
+        return response
@@ -0,0 +1,69 @@
+"""Month aggregate store."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.loader import async_get_integration
+
+from .const import DOMAIN
+from .hass_util import StorageJson
+from .wage_calc import WageCalc
+
+
+# ------------------------------------------------------------------
+def month_store_key(entry_id: str) -> str:
+    """Storage key of the month aggregates of an entry."""
+
+    return f"{DOMAIN}.{entry_id}.months"
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class MonthAggregateStore:
+    """Persistent cache of the month aggregates of an entry.
+
+    The cache is keyed by a signature of the schedule, country, holidays,
+    date overrides and integration version, when any of these changes the
+    stored aggregates are discarded.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        wage_calc: WageCalc,
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.wage_calc: WageCalc = wage_calc
+        self.storage: StorageJson = StorageJson(hass, month_store_key(entry_id))
+        self.signature: str = ""
+        self.version: str = ""
+
+    # ------------------------------------------------------------------
+    async def async_load(self) -> None:
+        """Load stored month aggregates if the signature matches."""
+
+        self.version = str((await async_get_integration(self.hass, DOMAIN)).version)
+        self.signature = self.wage_calc.month_aggregates_signature(self.version)
+
+        tmp_data: dict | None = await self.storage.async_read_settings()
+
+        if tmp_data is not None and tmp_data.get("signature") == self.signature:
+            self.wage_calc.import_month_aggregates(tmp_data.get("months", {}))
+
+    # ------------------------------------------------------------------
+    async def async_save(self) -> None:
+        """Save month aggregates if new months has been computed."""
+
+        if not self.wage_calc.month_aggregates_changed:
+            return
+
+        # The date overrides may have changed since the load
+        self.signature = self.wage_calc.month_aggregates_signature(self.version)
+
+        await self.storage.async_write_settings(
+            {
+                "signature": self.signature,
+                "months": self.wage_calc.export_month_aggregates(),
+            }
+        )
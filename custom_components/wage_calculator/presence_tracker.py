@@ -0,0 +1,147 @@
+"""Presence tracker."""
+
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.const import STATE_HOME, STATE_ON
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+ON_STATES: set[str] = {STATE_ON, STATE_HOME}
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class PresenceTracker:
+    """Presence tracker.
+
+    Worked time is the on-duration of an entity, aggregated per day from the
+    recorder history. A cursor keeps track of the last processed state change,
+    so each update only reads the state changes since the previous update.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.entity_id: str = entity_id
+
+        self.tracked_from: date | None = None
+
+        self._cursor: datetime | None = None
+        self._is_on: bool = False
+        self._day_seconds: dict[date, float] = {}
+
+    # ------------------------------------------------------------------
+    def _get_state_changes(
+        self, start_time: datetime, end_time: datetime, include_start_time_state: bool
+    ) -> list[State]:
+        """Get state changes from the recorder."""
+
+        return history.state_changes_during_period(
+            self.hass,
+            start_time,
+            end_time,
+            entity_id=self.entity_id,
+            no_attributes=True,
+            include_start_time_state=include_start_time_state,
+        ).get(self.entity_id, [])
+
+    # ------------------------------------------------------------------
+    async def async_update(self) -> None:
+        """Process state changes since the cursor."""
+
+        tmp_now: datetime = dt_util.utcnow()
+        tmp_month_start: date = dt_util.now().date().replace(day=1)
+        tmp_first_update: bool = self._cursor is None
+
+        tmp_start: datetime = (
+            dt_util.start_of_local_day(tmp_month_start)
+            if tmp_first_update
+            else self._cursor
+        )
+
+        states: list[State] = await get_instance(self.hass).async_add_executor_job(
+            self._get_state_changes, tmp_start, tmp_now, tmp_first_update
+        )
+
+        if tmp_first_update:
+            if len(states) == 0:
+                self.tracked_from = dt_util.as_local(tmp_now).date()
+                self._cursor = tmp_now
+                self._is_on = (
+                    state := self.hass.states.get(self.entity_id)
+                ) is not None and state.state in ON_STATES
+                return
+
+            self._cursor = max(states[0].last_changed, tmp_start)
+            self.tracked_from = dt_util.as_local(self._cursor).date()
+
+        for state in states:
+            if state.last_changed < self._cursor:
+                continue
+
+            self._accrue(self._day_seconds, self._cursor, state.last_changed)
+            self._cursor = state.last_changed
+            self._is_on = state.state in ON_STATES
+
+        for tmp_day in [
+            tmp_day for tmp_day in self._day_seconds if tmp_day < tmp_month_start
+        ]:
+            del self._day_seconds[tmp_day]
+
+        if self.tracked_from is not None and self.tracked_from < tmp_month_start:
+            self.tracked_from = tmp_month_start
+
+    # ------------------------------------------------------------------
+    def _accrue(
+        self, day_seconds: dict[date, float], start: datetime, end: datetime
+    ) -> None:
+        """Add on-duration between start and end, split by local day."""
+
+        if not self._is_on:
+            return
+
+        tmp_start: datetime = dt_util.as_local(start)
+        tmp_end: datetime = dt_util.as_local(end)
+
+        while tmp_start < tmp_end:
+            tmp_next_day: datetime = dt_util.start_of_local_day(
+                tmp_start.date() + timedelta(days=1)
+            )
+            tmp_stop: datetime = min(tmp_next_day, tmp_end)
+            day_seconds[tmp_start.date()] = (
+                day_seconds.get(tmp_start.date(), 0.0)
+                + (tmp_stop - tmp_start).total_seconds()
+            )
+            tmp_start = tmp_stop
+
+    # ------------------------------------------------------------------
+    def worked_minutes(self) -> dict[date, int]:
+        """Get worked minutes per day since tracking started.
+
+        The open interval since the last state change is added without moving
+        the cursor, state changes not yet committed by the recorder are picked
+        up at the next update.
+        """
+
+        if self.tracked_from is None or self._cursor is None:
+            return {}
+
+        tmp_now: datetime = dt_util.utcnow()
+        tmp_day_seconds: dict[date, float] = self._day_seconds.copy()
+        self._accrue(tmp_day_seconds, self._cursor, tmp_now)
+
+        tmp_minutes: dict[date, int] = {}
+        tmp_day: date = self.tracked_from
+        tmp_today: date = dt_util.as_local(tmp_now).date()
+
+        while tmp_day <= tmp_today:
+            tmp_minutes[tmp_day] = int(tmp_day_seconds.get(tmp_day, 0.0) // 60)
+            tmp_day += timedelta(days=1)
+
+        return tmp_minutes
@@ -2,21 +2,48 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import Any
+from datetime import date
 
 import voluptuous as vol
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.const import MATCH_ALL
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import entity_platform
+from homeassistant.const import CONF_COUNTRY_CODE, CONF_NAME, MATCH_ALL
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.selector import NumberSelector, NumberSelectorConfig
+from homeassistant.util import dt as dt_util
 
 from . import CommonConfigEntry
-from .const import CONF_FLEX_HOURS
+from .const import (
+    CONF_END_DATE,
+    CONF_FLEX_HOURS,
+    CONF_HOURLY_WAGE,
+    CONF_HOURS,
+    CONF_MONTHLY,
+    CONF_ROTATION_START,
+    CONF_SCHEDULE_WORK_HOURS,
+    CONF_SCHEDULES,
+    CONF_START_DATE,
+    CONF_TAX_TABLE,
+    DATE_OVERRIDES_MAX_DAYS,
+    DOMAIN,
+    FLEX_HISTORY_MAX_DAYS,
+    HOLIDAY_SOURCE_PATTERN,
+    ROTATION_MAX_WEEKS,
+    SIMULATION_MAX_DAYS,
+    SIMULATION_MAX_MONTH_ROWS,
+    SIMULATION_MAX_SCHEDULES,
+    TAX_TABLE_PATTERN,
+)
 from .entity import ComponentEntity
+from .wage_calc import WageCalc, minutes_to_hours
 
 
 # ------------------------------------------------------
@@ -30,10 +57,87 @@ async def async_setup_entry(
     sensors = []
 
     sensors.append(WageCalcSensor(hass, entry))
+    sensors.append(WageCalcYearSensor(hass, entry, year_to_date=True))
+    sensors.append(WageCalcYearSensor(hass, entry, year_to_date=False))
 
     async_add_entities(sensors)
 
 
+# ------------------------------------------------------
+def _rotation_work_hours(value: list[float]) -> list[float]:
+    """Validate work hours of whole weeks of a rotation."""
+
+    if len(value) % 7 != 0 or not 7 <= len(value) <= 7 * ROTATION_MAX_WEEKS:
+        raise vol.Invalid(
+            f"Expected work hours of 1 to {ROTATION_MAX_WEEKS} whole weeks"
+        )
+
+    return value
+
+
+# ------------------------------------------------------
+def _holiday_source(value: str) -> str:
+    """Validate a holiday source, a country code with optional subdivision."""
+
+    if not HOLIDAY_SOURCE_PATTERN.fullmatch(value):
+        raise vol.Invalid(f"Invalid holiday country: {value}")
+
+    return value
+
+
+# ------------------------------------------------------
+def _tax_table(value: str) -> str:
+    """Validate the name of a tax table."""
+
+    if not TAX_TABLE_PATTERN.fullmatch(value):
+        raise vol.Invalid(f"Invalid tax table: {value}")
+
+    return value
+
+
+SIMULATION_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_NAME): cv.string,
+        vol.Required(CONF_SCHEDULE_WORK_HOURS): vol.All(
+            cv.ensure_list,
+            [vol.All(vol.Coerce(float), vol.Range(min=0, max=24))],
+            _rotation_work_hours,
+        ),
+        vol.Optional(CONF_ROTATION_START): cv.date,
+        vol.Optional(CONF_HOURLY_WAGE): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_COUNTRY_CODE): vol.All(cv.string, _holiday_source),
+        vol.Optional(CONF_TAX_TABLE): vol.All(cv.string, _tax_table),
+    }
+)
+
+
+# ------------------------------------------------------
+def earning_anchor_attributes(calc: WageCalc) -> dict:
+    """Anchor for clients interpolating the earnings of today.
+
+    The earned value is valid at earned_at and grows with earning_rate per
+    second until rate_changes_at, where the state is updated again.
+    """
+
+    return {
+        "earned_at": calc.anchor_at.isoformat() if calc.anchor_at else None,
+        "earning_rate": calc.to_amount(calc.earning_rate_minor),
+        "rate_changes_at": (
+            calc.rate_changes_at.isoformat() if calc.rate_changes_at else None
+        ),
+    }
+
+
+# ------------------------------------------------------
+def net_salary_attributes(calc: WageCalc, net_salary_minor: int) -> dict:
+    """Estimated net salary, only with a tax table."""
+
+    if calc.tax_table is None:
+        return {}
+
+    return {"net_salary": calc.to_amount(net_salary_minor)}
+
+
 # ------------------------------------------------------
 # ------------------------------------------------------
 class WageCalcSensor(ComponentEntity, SensorEntity):
@@ -95,9 +199,55 @@ class WageCalcSensor(ComponentEntity, SensorEntity):
             },
             self.async_flex_hours_subtract,
         )
+        platform.async_register_entity_service(
+            "date_override_set",
+            {
+                vol.Required(CONF_START_DATE): cv.date,
+                vol.Optional(CONF_END_DATE): cv.date,
+                vol.Required(CONF_HOURS): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=24,
+                    )
+                ),
+            },
+            self.async_date_override_set,
+        )
+        platform.async_register_entity_service(
+            "date_override_remove",
+            {
+                vol.Required(CONF_START_DATE): cv.date,
+                vol.Optional(CONF_END_DATE): cv.date,
+            },
+            self.async_date_override_remove,
+        )
+        platform.async_register_entity_service(
+            "simulate",
+            {
+                vol.Required(CONF_SCHEDULES): vol.All(
+                    cv.ensure_list,
+                    vol.Length(min=1, max=SIMULATION_MAX_SCHEDULES),
+                    [SIMULATION_SCHEDULE_SCHEMA],
+                ),
+                vol.Optional(CONF_START_DATE): cv.date,
+                vol.Optional(CONF_END_DATE): cv.date,
+                vol.Optional(CONF_MONTHLY, default=False): cv.boolean,
+            },
+            self.async_simulate,
+            supports_response=SupportsResponse.ONLY,
+        )
+        platform.async_register_entity_service(
+            "flex_hours_history",
+            {
+                vol.Optional(CONF_START_DATE): cv.date,
+                vol.Optional(CONF_END_DATE): cv.date,
+            },
+            self.async_flex_hours_history,
+            supports_response=SupportsResponse.ONLY,
+        )
 
+        # Periodic updates are done by the ticker shared by all entries
         self.coordinator.update_method = self.async_refresh
-        self.coordinator.update_interval = timedelta(minutes=15)
 
     # ------------------------------------------------------------------
     async def async_flex_hours_set(
@@ -105,11 +255,9 @@ class WageCalcSensor(ComponentEntity, SensorEntity):
     ) -> None:
         """Set flex hours."""
 
-        entity.component_api.calc_monthly_wage.flex_hours = service_data.data.get(
-            CONF_FLEX_HOURS, 0.0
+        entity.component_api.async_set_flex_hours(
+            service_data.data.get(CONF_FLEX_HOURS, 0.0), service_data.service
         )
-
-        entity.update_config()
         await entity.coordinator.async_refresh()
 
     # ------------------------------------------------------------------
@@ -118,10 +266,9 @@ class WageCalcSensor(ComponentEntity, SensorEntity):
     ) -> None:
         """Add flex hours."""
 
-        entity.component_api.calc_monthly_wage.flex_hours += service_data.data.get(
-            CONF_FLEX_HOURS, 0.0
+        entity.component_api.async_add_flex_hours(
+            service_data.data.get(CONF_FLEX_HOURS, 0.0), service_data.service
         )
-        entity.update_config()
         await entity.coordinator.async_refresh()
 
     # ------------------------------------------------------------------
@@ -129,22 +276,123 @@ class WageCalcSensor(ComponentEntity, SensorEntity):
         self, entity: WageCalcSensor, service_data: ServiceCall
     ) -> None:
         """Add flex hours."""
-        entity.component_api.calc_monthly_wage.flex_hours -= service_data.data.get(
-            CONF_FLEX_HOURS, 0.0
+        entity.component_api.async_add_flex_hours(
+            -service_data.data.get(CONF_FLEX_HOURS, 0.0), service_data.service
+        )
+        await entity.coordinator.async_refresh()
+
+    # ------------------------------------------------------------------
+    async def async_date_override_set(
+        self, entity: WageCalcSensor, service_data: ServiceCall
+    ) -> None:
+        """Set work hours of days."""
+
+        entity.component_api.async_set_date_overrides(
+            *self.service_period(service_data), service_data.data[CONF_HOURS]
         )
-        entity.update_config()
         await entity.coordinator.async_refresh()
 
     # ------------------------------------------------------------------
-    def update_config(self) -> None:
-        """Update config."""
+    async def async_date_override_remove(
+        self, entity: WageCalcSensor, service_data: ServiceCall
+    ) -> None:
+        """Remove work hours of days."""
+
+        entity.component_api.async_set_date_overrides(
+            *self.service_period(service_data), None
+        )
+        await entity.coordinator.async_refresh()
+
+    # ------------------------------------------------------------------
+    async def async_flex_hours_history(
+        self, entity: WageCalcSensor, service_data: ServiceCall
+    ) -> ServiceResponse:
+        """Flex hours per month from the ledger, the current year by default."""
+
+        tmp_start: date = service_data.data.get(
+            CONF_START_DATE, dt_util.now().date().replace(month=1, day=1)
+        )
+        tmp_end: date = service_data.data.get(
+            CONF_END_DATE, tmp_start.replace(month=12, day=31)
+        )
+
+        if not 0 <= (tmp_end - tmp_start).days < FLEX_HISTORY_MAX_DAYS:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_period",
+                translation_placeholders={"max_days": str(FLEX_HISTORY_MAX_DAYS)},
+            )
+
+        return {
+            "start_date": tmp_start.isoformat(),
+            "end_date": tmp_end.isoformat(),
+            "months": entity.component_api.flex_hours_history(tmp_start, tmp_end),
+        }
 
-        tmp_options: dict[str, Any] = self.entry.options.copy()
-        tmp_options[CONF_FLEX_HOURS] = self.component_api.calc_monthly_wage.flex_hours
+    # ------------------------------------------------------------------
+    async def async_simulate(
+        self, entity: WageCalcSensor, service_data: ServiceCall
+    ) -> ServiceResponse:
+        """Simulate hypothetical schedules, the current year by default."""
 
-        self.hass.config_entries.async_update_entry(
-            self.entry, data=tmp_options, options=tmp_options
+        tmp_start: date = service_data.data.get(
+            CONF_START_DATE, dt_util.now().date().replace(month=1, day=1)
+        )
+        tmp_end: date = service_data.data.get(
+            CONF_END_DATE, tmp_start.replace(month=12, day=31)
         )
+        tmp_schedules: list[dict] = service_data.data[CONF_SCHEDULES]
+        tmp_monthly: bool = service_data.data[CONF_MONTHLY]
+
+        if not 0 <= (tmp_end - tmp_start).days < SIMULATION_MAX_DAYS:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_period",
+                translation_placeholders={"max_days": str(SIMULATION_MAX_DAYS)},
+            )
+
+        # Size of the response is capped by the rows of the monthly breakdown
+        if (
+            tmp_monthly
+            and len(tmp_schedules)
+            * (
+                (tmp_end.year - tmp_start.year) * 12
+                + tmp_end.month
+                - tmp_start.month
+                + 1
+            )
+            > SIMULATION_MAX_MONTH_ROWS
+        ):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="simulation_too_large",
+                translation_placeholders={"max_rows": str(SIMULATION_MAX_MONTH_ROWS)},
+            )
+
+        return {
+            "start_date": tmp_start.isoformat(),
+            "end_date": tmp_end.isoformat(),
+            "results": await entity.component_api.async_simulate(
+                tmp_schedules, tmp_start, tmp_end, tmp_monthly
+            ),
+        }
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def service_period(service_data: ServiceCall) -> tuple[date, date]:
+        """Start and end date of a service call, end defaults to start."""
+
+        tmp_start: date = service_data.data[CONF_START_DATE]
+        tmp_end: date = service_data.data.get(CONF_END_DATE, tmp_start)
+
+        if not 0 <= (tmp_end - tmp_start).days < DATE_OVERRIDES_MAX_DAYS:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_period",
+                translation_placeholders={"max_days": str(DATE_OVERRIDES_MAX_DAYS)},
+            )
+
+        return tmp_start, tmp_end
 
     # ------------------------------------------------------
     @property
@@ -167,7 +415,9 @@ class WageCalcSensor(ComponentEntity, SensorEntity):
             str | None: Native value
 
         """
-        return self.component_api.calc_monthly_wage.salary
+        return self.component_api.calc_monthly_wage.to_amount(
+            self.component_api.calc_monthly_wage.salary_minor
+        )
 
     # ------------------------------------------------------
     @property
@@ -185,17 +435,33 @@ class WageCalcSensor(ComponentEntity, SensorEntity):
             dict: Extra state attributes
 
         """
+        tmp_calc: WageCalc = self.component_api.calc_monthly_wage
+
         return {
-            "salary_before_today": self.component_api.calc_monthly_wage.salary_before_today,
-            "salary_after_today": self.component_api.calc_monthly_wage.salary_after_today,
-            "total_hours": self.component_api.calc_monthly_wage.total_hours,
-            "total_hours_before_today": self.component_api.calc_monthly_wage.total_hours_before_today,
-            "total_hours_after_today": self.component_api.calc_monthly_wage.total_hours_after_today,
-            "month_work_days": self.component_api.calc_monthly_wage.month_work_days,
-            "month_work_days_before_today": self.component_api.calc_monthly_wage.month_work_days_before_today,
-            "month_work_days_after_today": self.component_api.calc_monthly_wage.month_work_days_after_today,
-            "flex_hours": self.component_api.calc_monthly_wage.flex_hours,
+            "salary_before_today": tmp_calc.to_amount(
+                tmp_calc.salary_before_today_minor
+            ),
+            "salary_after_today": tmp_calc.to_amount(tmp_calc.salary_after_today_minor),
+            "total_hours": minutes_to_hours(tmp_calc.total_minutes),
+            "total_hours_before_today": minutes_to_hours(
+                tmp_calc.total_minutes_before_today
+            ),
+            "total_hours_after_today": minutes_to_hours(
+                tmp_calc.total_minutes_after_today
+            ),
+            "month_work_days": tmp_calc.month_work_days,
+            "month_work_days_before_today": tmp_calc.month_work_days_before_today,
+            "month_work_days_after_today": tmp_calc.month_work_days_after_today,
+            "flex_hours": tmp_calc.flex_hours,
+            "flex_hours_month": minutes_to_hours(
+                self.component_api.flex_ledger.month_net(tmp_calc.year, tmp_calc.month)
+            ),
             "markdown": self.component_api.markdown,
+            "earned": tmp_calc.to_amount(
+                tmp_calc.salery_before_today_with_hourly_update_minor
+            ),
+            **earning_anchor_attributes(tmp_calc),
+            **net_salary_attributes(tmp_calc, tmp_calc.net_salary_minor),
         }
 
     # ------------------------------------------------------
@@ -240,3 +506,132 @@ class WageCalcSensor(ComponentEntity, SensorEntity):
         self.async_on_remove(
             self.coordinator.async_add_listener(self.async_write_ha_state)
         )
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class WageCalcYearSensor(ComponentEntity, SensorEntity):
+    """Year to date or full year projection sensor for Wage calculator."""
+
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: CommonConfigEntry,
+        year_to_date: bool,
+    ) -> None:
+        """Wage calculator year sensor."""
+
+        super().__init__(entry.runtime_data.coordinator, entry)
+
+        self.hass: HomeAssistant = hass
+        self.entry: CommonConfigEntry = entry
+        self.component_api = entry.runtime_data.component_api
+        self.coordinator = entry.runtime_data.coordinator
+        self.year_to_date: bool = year_to_date
+
+        self.translation_key = "salary_ytd" if year_to_date else "salary_year"
+
+    # ------------------------------------------------------
+    @property
+    def name(self) -> str:
+        """Name.
+
+        Returns:
+            str: Name of sensor
+
+        """
+
+        return self.entry.title + " " + super().name
+
+    # ------------------------------------------------------
+    @property
+    def native_value(self) -> float | None:
+        """Native value.
+
+        Returns:
+            str | None: Native value
+
+        """
+        tmp_calc: WageCalc = self.component_api.calc_monthly_wage
+
+        return tmp_calc.to_amount(
+            tmp_calc.ytd_salary_minor
+            if self.year_to_date
+            else tmp_calc.year_salary_minor
+        )
+
+    # ------------------------------------------------------
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the unit the value is expressed in."""
+
+        return self.component_api.currency_sign
+
+    # ------------------------------------------------------
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Extra state attributes.
+
+        Returns:
+            dict: Extra state attributes
+
+        """
+        tmp_calc: WageCalc = self.component_api.calc_monthly_wage
+
+        tmp_attributes: dict = {
+            "year": tmp_calc.year,
+            "total_hours": minutes_to_hours(
+                tmp_calc.ytd_minutes if self.year_to_date else tmp_calc.year_minutes
+            ),
+        }
+
+        if self.year_to_date:
+            tmp_attributes.update(earning_anchor_attributes(tmp_calc))
+        else:
+            tmp_attributes.update(
+                net_salary_attributes(tmp_calc, tmp_calc.year_net_salary_minor)
+            )
+
+        return tmp_attributes
+
+    # ------------------------------------------------------
+    @property
+    def unique_id(self) -> str:
+        """Unique id.
+
+        Returns:
+            str: Unique  id
+
+        """
+        return (
+            self.entry.entry_id
+            + "_wage_calculator_"
+            + ("ytd" if self.year_to_date else "year")
+        )
+
+    # ------------------------------------------------------
+    @property
+    def should_poll(self) -> bool:
+        """No need to poll. Coordinator notifies entity of updates."""
+        return False
+
+    # ------------------------------------------------------
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.last_update_success
+
+    # ------------------------------------------------------
+    async def async_update(self) -> None:
+        """Update the entity. Only used by the generic entity update service."""
+        await self.coordinator.async_request_refresh()
+
+    # ------------------------------------------------------
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self.async_write_ha_state)
+        )
@@ -0,0 +1,116 @@
+"""Shift index."""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+
+from .wage_calc import WageCalc
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class YearIndex:
+    """Shifts and holidays of a year, sorted by time."""
+
+    shift_starts: list[datetime] = field(default_factory=list)
+    shift_ends: list[datetime] = field(default_factory=list)
+    holiday_days: list[date] = field(default_factory=list)
+    holiday_names: list[str] = field(default_factory=list)
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class ShiftIndex:
+    """Per year index of shifts and holidays.
+
+    A year is built once from the day records, after that windows are sliced
+    from the index by bisecting. The index is cleared when the calculation
+    inputs changes.
+    """
+
+    def __init__(self, calc: WageCalc) -> None:
+        """Init."""
+
+        self.calc: WageCalc = calc
+        self.signature: str = ""
+
+        self._years: dict[int, YearIndex] = {}
+
+    # ------------------------------------------------------------------
+    def validate(self) -> str:
+        """Clear the index if the inputs has changed, returns the signature."""
+
+        if (tmp_signature := self.calc.inputs_signature()) != self.signature:
+            self.signature = tmp_signature
+            self._years.clear()
+
+        return self.signature
+
+    # ------------------------------------------------------------------
+    def year_index(self, year: int) -> YearIndex:
+        """Get index of a year, built on first use.
+
+        Holidays of the year must be loaded, see WageCalc.async_iter_days.
+        """
+
+        if (tmp_index := self._years.get(year)) is not None:
+            return tmp_index
+
+        tmp_index = YearIndex()
+
+        for record in self.calc.iter_days(date(year, 1, 1), date(year, 12, 31)):
+            if record.holiday:
+                tmp_index.holiday_days.append(record.day)
+                tmp_index.holiday_names.append(record.holiday)
+
+            if record.minutes > 0:
+                tmp_start: datetime = self.calc.shift_start(record.day)
+                tmp_index.shift_starts.append(tmp_start)
+                tmp_index.shift_ends.append(
+                    tmp_start + timedelta(minutes=record.minutes)
+                )
+
+        self._years[year] = tmp_index
+        return tmp_index
+
+    # ------------------------------------------------------------------
+    def shifts(self, start: datetime, end: datetime) -> list[tuple[datetime, datetime]]:
+        """Shifts overlapping the period [start, end)."""
+
+        tmp_shifts: list[tuple[datetime, datetime]] = []
+
+        # Shifts starting the day before can end in the period
+        for year in range((start - timedelta(days=1)).year, end.year + 1):
+            tmp_index: YearIndex = self.year_index(year)
+            tmp_first: int = bisect_right(tmp_index.shift_ends, start)
+            tmp_last: int = bisect_left(tmp_index.shift_starts, end)
+            tmp_shifts.extend(
+                zip(
+                    tmp_index.shift_starts[tmp_first:tmp_last],
+                    tmp_index.shift_ends[tmp_first:tmp_last],
+                    strict=True,
+                )
+            )
+
+        return tmp_shifts
+
+    # ------------------------------------------------------------------
+    def holidays(self, start: date, end: date) -> list[tuple[date, str]]:
+        """Holidays in the period [start, end)."""
+
+        tmp_holidays: list[tuple[date, str]] = []
+
+        for year in range(start.year, end.year + 1):
+            tmp_index: YearIndex = self.year_index(year)
+            tmp_first: int = bisect_left(tmp_index.holiday_days, start)
+            tmp_last: int = bisect_left(tmp_index.holiday_days, end)
+            tmp_holidays.extend(
+                zip(
+                    tmp_index.holiday_days[tmp_first:tmp_last],
+                    tmp_index.holiday_names[tmp_first:tmp_last],
+                    strict=True,
+                )
+            )
+
+        return tmp_holidays
@@ -0,0 +1,196 @@
+"""What-if simulations of schedules in a process pool."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime
+import multiprocessing
+import os
+from pathlib import Path
+import runpy
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    SIMULATION_IDLE_TIMEOUT,
+    SIMULATION_MAX_WORKERS,
+    SIMULATION_TIMEOUT,
+)
+from .work_schedule import SimulationScenario, simulate_scenario
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class WageSimulator:
+    """What-if simulations shared by all entries of the integration.
+
+    Scenarios are evaluated with the work schedule engine of the sensors in
+    a process pool, created in the executor on first use and shut down when
+    idle and with Home Assistant. Worker processes are spawned from the
+    executor, so they do not inherit the threads of the event loop, and they
+    import the engine without Home Assistant, see simulation_worker.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._running: int = 0
+        self._unsub_idle: Callable[[], None] | None = None
+        self._unsub_stop: Callable[[], None] | None = None
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _create_pool() -> ProcessPoolExecutor:
+        """Create the process pool.
+
+        Blocking, must be run in the executor.
+        """
+
+        return ProcessPoolExecutor(
+            max_workers=min(SIMULATION_MAX_WORKERS, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=runpy.run_path,
+            initargs=(
+                str(Path(__file__).with_name("simulation_worker.py")),
+                {
+                    "worker_package": __package__,
+                    "worker_package_path": str(Path(__file__).parent),
+                },
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _submit(
+        pool: ProcessPoolExecutor,
+        scenarios: list[SimulationScenario],
+        start: date,
+        end: date,
+        monthly: bool,
+    ) -> list[Future[dict]]:
+        """Submit scenarios, worker processes are started on demand.
+
+        Blocking, must be run in the executor.
+        """
+
+        return [
+            pool.submit(simulate_scenario, scenario, start, end, monthly)
+            for scenario in scenarios
+        ]
+
+    # ------------------------------------------------------------------
+    async def _async_get_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool, created on first use."""
+
+        async with self._lock:
+            if self._pool is None:
+                self._pool = await self.hass.async_add_executor_job(self._create_pool)
+
+            if self._unsub_stop is None:
+                self._unsub_stop = self.hass.bus.async_listen_once(
+                    EVENT_HOMEASSISTANT_STOP, self._async_hass_stop
+                )
+
+        return self._pool
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_shutdown(self) -> None:
+        """Shut down the process pool, pending scenarios are dropped."""
+
+        if self._unsub_idle is not None:
+            self._unsub_idle()
+            self._unsub_idle = None
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_hass_stop(self, event: Event) -> None:
+        """Shut down the process pool with Home Assistant."""
+
+        self._unsub_stop = None
+        self._async_shutdown()
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_idle(self, _now: datetime) -> None:
+        """Shut down the process pool when no simulations has run for a while."""
+
+        self._unsub_idle = None
+
+        if self._running == 0:
+            self._async_shutdown()
+
+    # ------------------------------------------------------------------
+    async def async_simulate(
+        self,
+        scenarios: list[SimulationScenario],
+        start: date,
+        end: date,
+        monthly: bool = False,
+    ) -> list[dict]:
+        """Simulate scenarios from start to end in parallel.
+
+        Scenarios not yet started are cancelled if the caller is cancelled,
+        a scenario fails or the simulation times out.
+        """
+
+        if self._unsub_idle is not None:
+            self._unsub_idle()
+            self._unsub_idle = None
+
+        self._running += 1
+        tmp_futures: list[asyncio.Future[dict]] = []
+
+        try:
+            async with asyncio.timeout(SIMULATION_TIMEOUT.total_seconds()):
+                tmp_pool: ProcessPoolExecutor = await self._async_get_pool()
+                tmp_futures = [
+                    asyncio.wrap_future(future)
+                    for future in await self.hass.async_add_executor_job(
+                        self._submit, tmp_pool, scenarios, start, end, monthly
+                    )
+                ]
+                return await asyncio.gather(*tmp_futures)
+
+        except TimeoutError as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="simulation_timeout",
+                translation_placeholders={
+                    "timeout": str(int(SIMULATION_TIMEOUT.total_seconds()))
+                },
+            ) from err
+
+        except BrokenProcessPool as err:
+            # A worker died, the next simulation starts a new pool
+            self._async_shutdown()
+
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="simulation_failed",
+            ) from err
+
+        finally:
+            for future in tmp_futures:
+                future.cancel()
+
+            self._running -= 1
+
+            if self._running == 0 and self._pool is not None:
+                self._unsub_idle = async_call_later(
+                    self.hass, SIMULATION_IDLE_TIMEOUT, self._async_idle
+                )
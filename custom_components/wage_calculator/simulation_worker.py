@@ -0,0 +1,16 @@
+"""Start of the simulation worker processes.
+
+Run by path in each worker process before the first scenario, it is not
+imported. The integration package is registered without running its init,
+so the work schedule engine is imported without Home Assistant.
+
+The package name and path are given as the globals worker_package and
+worker_package_path.
+"""
+
+import sys
+import types
+
+tmp_package: types.ModuleType = types.ModuleType(globals()["worker_package"])
+tmp_package.__path__ = [globals()["worker_package_path"]]
+sys.modules.setdefault(tmp_package.__name__, tmp_package)
@@ -0,0 +1,217 @@
+"""Tax table.
+
+Net pay is estimated from a JSON definition of the deductions of a month,
+amounts are in the currency of the entry:
+
+    {
+        "allowance": 4300,
+        "contributions": [{"name": "labour_market", "rate": 0.08}],
+        "deductions": [{"name": "union", "amount": 450, "before_tax": false}],
+        "brackets": [{"from": 0, "rate": 0.37}, {"from": 50000, "rate": 0.52}]
+    }
+
+Contributions are a percentage of the gross pay and deductions a fixed
+amount, both taken from the pay and by default before tax. The allowance
+only lowers the taxable amount. Brackets are marginal rates from a taxable
+amount and up.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+import json
+from pathlib import Path
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class TaxTable:
+    """Tax table compiled to minor currency units.
+
+    Brackets are sorted threshold arrays with the cumulative tax at each
+    threshold, so the tax of an amount is a bisect plus a lookup.
+    """
+
+    contribution_rate_before_tax: float
+    contribution_rate_after_tax: float
+    deduction_before_tax_minor: int
+    deduction_after_tax_minor: int
+    allowance_minor: int
+    thresholds: list[int]
+    rates: list[float]
+    cumulative: list[float]
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def compile(definition: dict, currency_digits: int) -> TaxTable:
+        """Compile a JSON definition, raises ValueError if invalid."""
+
+        tmp_scale: int = 10**currency_digits
+
+        try:
+            tmp_contributions: list[dict] = definition.get("contributions", [])
+            tmp_deductions: list[dict] = definition.get("deductions", [])
+            tmp_brackets: list[tuple[int, float]] = sorted(
+                (round(float(bracket["from"]) * tmp_scale), float(bracket["rate"]))
+                for bracket in definition.get("brackets", [])
+            )
+            tmp_rate_before: float = sum(
+                float(item["rate"])
+                for item in tmp_contributions
+                if item.get("before_tax", True)
+            )
+            tmp_rate_after: float = sum(
+                float(item["rate"])
+                for item in tmp_contributions
+                if not item.get("before_tax", True)
+            )
+            tmp_deduction_before: int = sum(
+                round(float(item["amount"]) * tmp_scale)
+                for item in tmp_deductions
+                if item.get("before_tax", True)
+            )
+            tmp_deduction_after: int = sum(
+                round(float(item["amount"]) * tmp_scale)
+                for item in tmp_deductions
+                if not item.get("before_tax", True)
+            )
+            tmp_allowance: int = round(
+                float(definition.get("allowance", 0)) * tmp_scale
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            raise ValueError(f"Invalid tax table: {err}") from err
+
+        if not 0 <= tmp_rate_before + tmp_rate_after <= 1:
+            raise ValueError("Invalid tax table: contributions must be 0 to 100%")
+
+        if any(not 0 <= rate <= 1 for _from, rate in tmp_brackets):
+            raise ValueError("Invalid tax table: bracket rates must be 0 to 100%")
+
+        # Amounts below the first bracket are not taxed
+        if not tmp_brackets or tmp_brackets[0][0] > 0:
+            tmp_brackets.insert(0, (0, 0.0))
+
+        tmp_thresholds: list[int] = [threshold for threshold, _rate in tmp_brackets]
+        tmp_rates: list[float] = [rate for _threshold, rate in tmp_brackets]
+        tmp_cumulative: list[float] = [0.0]
+
+        for index in range(1, len(tmp_thresholds)):
+            tmp_cumulative.append(
+                tmp_cumulative[-1]
+                + (tmp_thresholds[index] - tmp_thresholds[index - 1])
+                * tmp_rates[index - 1]
+            )
+
+        return TaxTable(
+            tmp_rate_before,
+            tmp_rate_after,
+            tmp_deduction_before,
+            tmp_deduction_after,
+            tmp_allowance,
+            tmp_thresholds,
+            tmp_rates,
+            tmp_cumulative,
+        )
+
+    # ------------------------------------------------------------------
+    def _taxable_minor(self, gross_minor: int) -> int:
+        """Taxable amount of a gross pay."""
+
+        return max(
+            0,
+            gross_minor
+            - round(gross_minor * self.contribution_rate_before_tax)
+            - self.deduction_before_tax_minor
+            - self.allowance_minor,
+        )
+
+    # ------------------------------------------------------------------
+    def _tax_minor(self, taxable_minor: int, bracket: int) -> int:
+        """Tax of a taxable amount in a bracket, rounded half up."""
+
+        return int(
+            self.cumulative[bracket]
+            + (taxable_minor - self.thresholds[bracket]) * self.rates[bracket]
+            + 0.5
+        )
+
+    # ------------------------------------------------------------------
+    def _net_minor(self, gross_minor: int, tax_minor: int) -> int:
+        """Net pay of a gross pay and its tax.
+
+        Fixed deductions are only taken from the pay there is, so the net pay
+        of a month without work is 0 and not negative.
+        """
+
+        return max(
+            0,
+            gross_minor
+            - round(gross_minor * self.contribution_rate_before_tax)
+            - round(gross_minor * self.contribution_rate_after_tax)
+            - self.deduction_before_tax_minor
+            - self.deduction_after_tax_minor
+            - tax_minor,
+        )
+
+    # ------------------------------------------------------------------
+    def net_minor(self, gross_minor: int) -> int:
+        """Net pay of a month."""
+
+        tmp_taxable: int = self._taxable_minor(gross_minor)
+
+        return self._net_minor(
+            gross_minor,
+            self._tax_minor(
+                tmp_taxable, bisect_right(self.thresholds, tmp_taxable) - 1
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    def net_minor_many(self, gross_minor: Sequence[int]) -> list[int]:
+        """Net pay of many months, in the order given.
+
+        The taxable amount grows with the gross pay, so the amounts are
+        evaluated in sorted order with a single walk over the brackets.
+        """
+
+        tmp_net: list[int] = [0] * len(gross_minor)
+        tmp_bracket: int = 0
+
+        for index in sorted(range(len(gross_minor)), key=gross_minor.__getitem__):
+            tmp_taxable: int = self._taxable_minor(gross_minor[index])
+
+            while (
+                tmp_bracket + 1 < len(self.thresholds)
+                and self.thresholds[tmp_bracket + 1] <= tmp_taxable
+            ):
+                tmp_bracket += 1
+
+            tmp_net[index] = self._net_minor(
+                gross_minor[index], self._tax_minor(tmp_taxable, tmp_bracket)
+            )
+
+        return tmp_net
+
+
+# ------------------------------------------------------------------
+def load_tax_table(path: Path, currency_digits: int) -> TaxTable | None:
+    """Load and compile a tax table, None if the file does not exist.
+
+    Raises ValueError if the file is not a valid tax table, and TypeError if
+    it does not contain a JSON object.
+    """
+
+    try:
+        tmp_definition = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as err:
+        raise ValueError(f"Unable to read tax table {path}: {err}") from err
+
+    if not isinstance(tmp_definition, dict):
+        raise TypeError(f"Invalid tax table {path}: expected an object")
+
+    return TaxTable.compile(tmp_definition, currency_digits)
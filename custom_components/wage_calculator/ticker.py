@@ -0,0 +1,218 @@
+"""Ticker shared by all entries of the integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from functools import partial
+from random import uniform
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    LOGGER,
+    UPDATE_INTERVAL,
+    UPDATE_LAG_HIGH,
+    UPDATE_LAG_LOW,
+    UPDATE_MAX_INTERVAL,
+    UPDATE_MAX_JITTER,
+)
+from .hass_util import TimerScheduler
+
+if TYPE_CHECKING:
+    from .component_api import ComponentApi
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class WageTicker:
+    """Ticker shared by all entries of the integration.
+
+    Updates each entry once per interval through the shared timer scheduler.
+    Listeners are only notified for entries where the values has changed, or
+    which recovers from a failed update.
+
+    Ticks are aligned to wall clock multiples of the interval, e.g. the
+    quarter hours, plus a jitter drawn per entry between zero and max jitter,
+    so entries does not all update in the same instant.
+
+    The effective interval adapts to the event loop lag measured at each
+    tick, it is doubled up to max interval when the loop is busy and halved
+    back to the interval when the loop is idle. Shift starts, shift ends and
+    midnight are scheduled as exact events and are not affected.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        interval: timedelta = UPDATE_INTERVAL,
+        max_interval: timedelta = UPDATE_MAX_INTERVAL,
+        max_jitter: timedelta = UPDATE_MAX_JITTER,
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.interval: timedelta = interval
+        self.max_interval: timedelta = max(max_interval, interval)
+        self.effective_interval: timedelta = interval
+        self.loop_lag: float = 0.0
+        self.max_jitter: timedelta = min(max_jitter, interval)
+        self.jitters: dict[str, timedelta] = {}
+        self._component_apis: list[ComponentApi] = []
+        self._unsub_ticks: dict[str, Callable[[], None]] = {}
+        self._unsub_midnight: Callable[[], None] | None = None
+        self._unsub_shift_events: dict[str, Callable[[], None]] = {}
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_add(self, component_api: ComponentApi) -> Callable[[], None]:
+        """Add entry to the ticker, returns function to remove it again."""
+
+        tmp_entry_id: str = component_api.entry.entry_id
+        self._component_apis.append(component_api)
+        self.jitters[tmp_entry_id] = timedelta(
+            seconds=uniform(0, self.max_jitter.total_seconds())
+        )
+        self._async_schedule_tick(component_api)
+        self._async_schedule_shift_event(component_api)
+
+        if self._unsub_midnight is None:
+            self._async_schedule_midnight()
+
+        # ------------------------------------------------------------------
+        @callback
+        def async_remove() -> None:
+            self._component_apis.remove(component_api)
+            self.jitters.pop(tmp_entry_id, None)
+
+            for unsubs in (self._unsub_ticks, self._unsub_shift_events):
+                if (tmp_unsub := unsubs.pop(tmp_entry_id, None)) is not None:
+                    tmp_unsub()
+
+            if len(self._component_apis) == 0 and self._unsub_midnight is not None:
+                self._unsub_midnight()
+                self._unsub_midnight = None
+
+        return async_remove
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_schedule_tick(self, component_api: ComponentApi) -> None:
+        """Schedule next tick of an entry in the shared timer scheduler."""
+
+        self._unsub_ticks[component_api.entry.entry_id] = TimerScheduler.async_get(
+            self.hass
+        ).async_schedule(
+            self.next_tick(
+                dt_util.utcnow(), self.jitters[component_api.entry.entry_id]
+            ),
+            partial(self._async_tick, component_api),
+        )
+
+    # ------------------------------------------------------------------
+    def next_tick(self, now: datetime, jitter: timedelta) -> datetime:
+        """Next wall clock aligned tick after now."""
+
+        tmp_tick: datetime = (
+            TimerScheduler.align_time(now - jitter, self.effective_interval) + jitter
+        )
+
+        if tmp_tick <= now:
+            tmp_tick += self.effective_interval
+
+        return tmp_tick
+
+    # ------------------------------------------------------------------
+    def adapt_interval(self, loop_lag: float) -> None:
+        """Adapt the effective interval to the event loop lag in seconds."""
+
+        self.loop_lag = loop_lag
+
+        if loop_lag >= UPDATE_LAG_HIGH:
+            self.effective_interval = min(
+                self.effective_interval * 2, self.max_interval
+            )
+
+        elif loop_lag <= UPDATE_LAG_LOW:
+            self.effective_interval = max(self.effective_interval / 2, self.interval)
+
+    # ------------------------------------------------------------------
+    async def _async_tick(self, component_api: ComponentApi, now: datetime) -> None:
+        """Update an entry."""
+
+        self.adapt_interval((dt_util.utcnow() - now).total_seconds())
+        self._async_schedule_tick(component_api)
+        await self.async_update_entries([component_api])
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_schedule_midnight(self) -> None:
+        """Schedule update of all entries at local midnight."""
+
+        self._unsub_midnight = TimerScheduler.async_get(self.hass).async_schedule(
+            dt_util.start_of_local_day(dt_util.now().date() + timedelta(days=1)),
+            self._async_midnight,
+        )
+
+    # ------------------------------------------------------------------
+    async def _async_midnight(self, now: datetime) -> None:
+        """Update all entries at day and month rollover."""
+
+        self._async_schedule_midnight()
+        await self.async_update_entries(self._component_apis)
+
+        for component_api in self._component_apis:
+            self._async_schedule_shift_event(component_api)
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_schedule_shift_event(self, component_api: ComponentApi) -> None:
+        """Schedule update of an entry at the next shift start or end."""
+
+        if (
+            tmp_unsub := self._unsub_shift_events.pop(
+                component_api.entry.entry_id, None
+            )
+        ) is not None:
+            tmp_unsub()
+
+        if (
+            tmp_when := component_api.calc_monthly_wage.next_shift_event(dt_util.now())
+        ) is None:
+            return
+
+        self._unsub_shift_events[component_api.entry.entry_id] = (
+            TimerScheduler.async_get(self.hass).async_schedule(
+                tmp_when, partial(self._async_shift_event, component_api)
+            )
+        )
+
+    # ------------------------------------------------------------------
+    async def _async_shift_event(
+        self, component_api: ComponentApi, now: datetime
+    ) -> None:
+        """Update an entry at shift start or end."""
+
+        self._async_schedule_shift_event(component_api)
+        await self.async_update_entries([component_api])
+
+    # ------------------------------------------------------------------
+    async def async_update_entries(self, component_apis: list[ComponentApi]) -> None:
+        """Update entries."""
+
+        for component_api in component_apis:
+            try:
+                # Unchanged values are pushed too after a failed update, so the
+                # entities are available again
+                if (
+                    await component_api.async_update()
+                    or not component_api.coordinator.last_update_success
+                ):
+                    component_api.coordinator.async_set_updated_data(None)
+
+            except (HomeAssistantError, LookupError, OSError, ValueError) as err:
+                LOGGER.error("Error updating %s: %s", component_api.entry.title, err)
+                component_api.coordinator.async_set_update_error(err)
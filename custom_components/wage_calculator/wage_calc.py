@@ -1,14 +1,43 @@
-"""Wage calc."""
+"""Wage calc.
 
-from calendar import monthrange, weekday
-from datetime import UTC, date, datetime, time, timedelta
+Hours are kept as integer minutes and amounts as integer minor currency units,
+conversion to hours and amounts is only done for display.
+"""
 
-from holidays import HolidayBase, country_holidays
+from asyncio import sleep
+from calendar import monthrange
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from hashlib import sha1
 
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
-from .hass_util import async_hass_add_executor_job
+from .const import DAY_RECORDS_CHUNK_DAYS, DayOfWeekEnum
+from .domain_data import async_get_domain_data
+from .holiday_set import HolidaySet
+from .tax_table import TaxTable
+from .work_schedule import (
+    MonthAggregate,
+    WorkSchedule,
+    hours_to_minutes,
+    minutes_to_hours,
+    wage_for_minutes,
+)
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class DayRecord:
+    """Scheduled work and earnings of a day, without flex hours."""
+
+    day: date
+    weekday: str
+    holiday: str
+    minutes: int
+    earned_minor: int
 
 
 # ------------------------------------------------------------------
@@ -25,78 +54,269 @@ class WageCalc:
         flex_hours: float = 0.0,
         country: str = "DK",
         update_continuously: bool = True,
+        currency_digits: int = 2,
+        holiday_sources: list[str] | None = None,
+        holiday_intersection: bool = False,
+        include_dates: list[date] | None = None,
+        exclude_dates: list[date] | None = None,
+        include_name: str = "",
+        rotation_start: date | None = None,
     ) -> None:
-        """Initialize WageCalc."""
+        """Initialize WageCalc.
+
+        Work hours and start times are given for each day of one or more
+        weeks, a rotation of N weeks repeats from the week of rotation start.
+        """
 
         self.hass: HomeAssistant = hass
 
-        self._work_hours_week: list[float] = weekly_work_hours
+        self.schedule: WorkSchedule = WorkSchedule(
+            weekly_work_hours, weekly_work_starts_at, rotation_start
+        )
 
-        self._flex_hours: float = flex_hours
-        self._country: str = country
+        self._flex_minutes: int = hours_to_minutes(flex_hours)
+        self.country: str = country
+        self.holiday_sources: list[str] = holiday_sources or [country]
+        self._holiday_intersection: bool = holiday_intersection
+        self._include_dates: list[date] = include_dates or []
+        self._exclude_dates: list[date] = exclude_dates or []
+        self._include_name: str = include_name
         self._update_continuously: bool = update_continuously
-        self._work_starts_at_week: time = [
-            datetime.strptime(t, "%H:%M:%S").time() for t in weekly_work_starts_at
-        ]
 
         self._same_month_year: bool = False
 
         self.month_work_days: int = 0
-        self.total_hours: float = 0.0
+        self.total_minutes: int = 0
         self.month_work_days_before_today: int = 0
-        self.total_hours_before_today: float = 0.0
+        self.total_minutes_before_today: int = 0
         self.month_work_days_after_today: int = 0
-        self.total_hours_after_today: float = 0.0
+        self.total_minutes_after_today: int = 0
 
         self.year: int = 0
         self.month: int = 0
         self.day: int = 0
-        self.hourly_wage: float = hourly_wage
-        self.holidays: HolidayBase = None
-        self.salary: float = 0.0
-        self.salary_before_today: float = 0.0
-        self.salery_before_today_with_hourly_update: float = 0.0
-        self.salary_after_today: float = 0.0
-        self.today_hours: float = 0.0
+        self.currency_digits: int = currency_digits
+        self.hourly_wage_minor: int = round(hourly_wage * 10**currency_digits)
+        self.holidays: HolidaySet = None
+        self.salary_minor: int = 0
+        self.salary_before_today_minor: int = 0
+        self.salery_before_today_with_hourly_update_minor: int = 0
+        self.salary_after_today_minor: int = 0
+        self.today_minutes: int = 0
+        self.calendar_overlay: dict[date, int] = {}
+        self.date_overrides: dict[date, int] = {}
+        self.worked_minutes: dict[date, int] | None = None
+
+        self.earning: bool = False
+        self.anchor_at: datetime | None = None
+        self.rate_changes_at: datetime | None = None
+
+        self._month_aggregates: dict[tuple[int, int], MonthAggregate] = {}
+        self.month_aggregates_changed: bool = False
+        self.ytd_minutes: int = 0
+        self.ytd_salary_minor: int = 0
+        self.year_minutes: int = 0
+        self.year_salary_minor: int = 0
+
+        self.tax_table: TaxTable | None = None
+        self.net_salary_minor: int = 0
+        self.year_net_salary_minor: int = 0
+        self._year_net_key: tuple[int, ...] = ()
 
     # ------------------------------------------------------------------
     async def async_init(self) -> None:
         """Initialize the component."""
 
-        await self.get_holidays(self._country)
+        if self.holidays is None:
+            await self.async_get_holidays()
 
+        await self.async_load_holidays()
         self.calculate()
 
     # ------------------------------------------------------------------
-    @async_hass_add_executor_job()
-    def get_holidays(self, country: str) -> None:
-        """Get holidays."""
+    async def async_get_holidays(self) -> None:
+        """Get holidays of the sources, shared with other entries."""
+
+        tmp_provider = async_get_domain_data(self.hass).holiday_provider
+
+        self.holidays = HolidaySet(
+            [
+                await tmp_provider.async_get_holidays(source)
+                for source in self.holiday_sources
+            ],
+            self._holiday_intersection,
+            self._include_dates,
+            self._exclude_dates,
+            self._include_name,
+        )
+
+    # ------------------------------------------------------------------
+    async def async_load_holidays(self) -> None:
+        """Load holidays of the years used by calculate in the executor.
+
+        Next year is included, as the next shift can be in the next year.
+        """
+
+        tmp_year: int = dt_util.now().year
 
-        self.holidays = country_holidays(country)
+        await async_get_domain_data(self.hass).holiday_provider.async_load_years(
+            self.holidays, range(tmp_year, tmp_year + 2)
+        )
 
     # ------------------------------------------------------------------
-    def calc_todays_work(self) -> float:
-        """Calculate todays work."""
+    def to_amount(self, amount_minor: int) -> float:
+        """Convert minor currency units to an amount for display."""
 
-        tmp_now: datetime = dt_util.as_local(datetime.now(UTC))
-        tmp_todays_work_hours: timedelta = tmp_now - dt_util.as_local(
-            datetime.combine(
-                date.today(),
-                self._work_starts_at_week[weekday(self.year, self.month, self.day)],
-                tzinfo=tmp_now.tzinfo,
-            )
+        return amount_minor / 10**self.currency_digits
+
+    # ------------------------------------------------------------------
+    def day_work_minutes(self, day: date) -> int:
+        """Get work minutes for a day.
+
+        The calendar overlay takes precedence over date overrides, which takes
+        precedence over holidays and the weekly schedule.
+        """
+
+        if (tmp_minutes := self.calendar_overlay.get(day)) is not None:
+            return tmp_minutes
+
+        if (tmp_minutes := self.date_overrides.get(day)) is not None:
+            return tmp_minutes
+
+        if day in self.holidays:
+            return 0
+
+        return self.scheduled_minutes(day)
+
+    # ------------------------------------------------------------------
+    def scheduled_minutes(self, day: date) -> int:
+        """Work minutes of a day from the rotation only."""
+
+        return self.schedule.scheduled_minutes(day)
+
+    # ------------------------------------------------------------------
+    def range_aggregate(
+        self, start: date, end: date, worked_minutes: dict[date, int] | None = None
+    ) -> MonthAggregate:
+        """Work days and minutes from start to end, both included.
+
+        Only the days deviating from the rotation are corrected, worked
+        minutes replaces the minutes of the days they contain.
+        """
+
+        if end < start:
+            return MonthAggregate()
+
+        tmp_exceptions: set[date] = {
+            day for day in self.calendar_overlay if start <= day <= end
+        }
+        tmp_exceptions.update(day for day in self.date_overrides if start <= day <= end)
+        tmp_exceptions.update(self.holidays.days(start, end))
+
+        if worked_minutes is not None:
+            tmp_exceptions.update(day for day in worked_minutes if start <= day <= end)
+
+        return self.schedule.range_aggregate(
+            start,
+            end,
+            tmp_exceptions,
+            lambda day: (
+                worked_minutes[day]
+                if worked_minutes is not None and day in worked_minutes
+                else self.day_work_minutes(day)
+            ),
         )
 
-        tmp_today_hours: float = tmp_todays_work_hours.total_seconds() // 3600 + (
-            int(((tmp_todays_work_hours.total_seconds() % 3600) // 60) * 1.6666666667)
-            / 100
+    # ------------------------------------------------------------------
+    def shift_start(self, day: date) -> datetime:
+        """Start of the shift of a day in local time."""
+
+        return datetime.combine(
+            day,
+            self.schedule.start_time(day),
+            tzinfo=dt_util.get_default_time_zone(),
         )
 
+    # ------------------------------------------------------------------
+    def iter_days(self, start: date, end: date) -> Iterator[DayRecord]:
+        """Lazily yield a record per day from start to end, both included.
+
+        Holidays of the years must be loaded, see async_iter_days.
+        """
+
+        tmp_weekdays: list[str] = [day.value for day in DayOfWeekEnum]
+        tmp_day: date = start
+
+        while tmp_day <= end:
+            tmp_minutes: int = self.day_work_minutes(tmp_day)
+
+            yield DayRecord(
+                tmp_day,
+                tmp_weekdays[tmp_day.weekday()],
+                self.holidays.get(tmp_day, ""),
+                tmp_minutes,
+                wage_for_minutes(tmp_minutes, self.hourly_wage_minor),
+            )
+            tmp_day += timedelta(days=1)
+
+    # ------------------------------------------------------------------
+    async def async_iter_days(
+        self, start: date, end: date, chunk_days: int = DAY_RECORDS_CHUNK_DAYS
+    ) -> AsyncIterator[DayRecord]:
+        """Lazily yield a record per day from start to end, both included.
+
+        Holidays of the years are loaded in the executor first, and the event
+        loop is released after each chunk of days.
+        """
+
+        await async_get_domain_data(self.hass).holiday_provider.async_load_years(
+            self.holidays, range(start.year, end.year + 1)
+        )
+
+        for count, record in enumerate(self.iter_days(start, end), 1):
+            yield record
+
+            if count % chunk_days == 0:
+                await sleep(0)
+
+    # ------------------------------------------------------------------
+    def next_shift_event(self, now: datetime) -> datetime | None:
+        """Next shift start or shift end after now.
+
+        Only used when updating continuously, otherwise values do not change
+        during the day.
+        """
+
+        if not self._update_continuously or self.worked_minutes is not None:
+            return None
+
+        for days in range(8):
+            tmp_day: date = now.date() + timedelta(days=days)
+
+            if (tmp_minutes := self.day_work_minutes(tmp_day)) == 0:
+                continue
+
+            tmp_start: datetime = self.shift_start(tmp_day)
+
+            for tmp_event in (tmp_start, tmp_start + timedelta(minutes=tmp_minutes)):
+                if tmp_event > now:
+                    return tmp_event
+
+        return None
+
+    # ------------------------------------------------------------------
+    def calc_todays_work(self, now: datetime | None = None) -> int:
+        """Calculate todays work in minutes."""
+
+        tmp_today: date = date(self.year, self.month, self.day)
+        tmp_now: datetime = now or dt_util.as_local(datetime.now(UTC))
+        tmp_todays_work: timedelta = tmp_now - self.shift_start(tmp_today)
+
         return max(
             0,
             min(
-                tmp_today_hours,
-                self._work_hours_week[weekday(self.year, self.month, self.day)],
+                int(tmp_todays_work.total_seconds() // 60),
+                self.day_work_minutes(tmp_today),
             ),
         )
 
@@ -106,11 +326,18 @@ class WageCalc:
 
         self._same_month_year = False
         self.month_work_days = 0
-        self.total_hours = 0.0
+        self.total_minutes = 0
         self.month_work_days_before_today = 0
-        self.total_hours_before_today = 0.0
+        self.total_minutes_before_today = 0
         self.month_work_days_after_today = 0
-        self.total_hours_after_today = 0.0
+        self.total_minutes_after_today = 0
+
+        tmp_today_done: bool = False
+        tmp_now: datetime = dt_util.now()
+
+        self.earning = False
+        self.anchor_at = None
+        self.rate_changes_at = None
 
         if year == 0 or month == 0:
             self.year = date.today().year
@@ -124,76 +351,305 @@ class WageCalc:
             self._same_month_year = True
             self.day = date.today().day
 
-            if self._update_continuously:
-                self.today_hours = self.calc_todays_work()
+            if self.worked_minutes is not None:
+                self.today_minutes = self.worked_minutes.get(
+                    date(self.year, self.month, self.day), 0
+                )
+
+            elif self._update_continuously:
+                self.today_minutes = self.calc_todays_work(tmp_now)
 
                 # Check if todays work hours is done
-                if (
-                    self.today_hours > 0
-                    and self.today_hours
-                    >= self._work_hours_week[weekday(self.year, self.month, self.day)]
+                if self.today_minutes > 0 and self.today_minutes >= (
+                    self.day_work_minutes(date(self.year, self.month, self.day))
+                ):
+                    self.today_minutes = 0
+                    tmp_today_done = True
+
+                # Earning during the shift, anchored at the last whole minute
+                elif (tmp_start := self.shift_start(tmp_now.date())) <= tmp_now and (
+                    self.day_work_minutes(tmp_now.date()) > 0
                 ):
-                    self.total_hours_before_today += self._work_hours_week[
-                        weekday(self.year, self.month, self.day)
-                    ]
-                    self.today_hours = 0
-                    self.month_work_days_before_today += 1
-                    self.month_work_days_after_today -= 1
-
-        for day in range(1, (monthrange(self.year, self.month))[1] + 1):
-            if date(self.year, self.month, day) not in self.holidays:
-                if (
-                    day_work_hours := self._work_hours_week[
-                        weekday(self.year, self.month, day)
-                    ]
-                ) != 0.0:
-                    self.month_work_days += 1
-                    self.total_hours += day_work_hours
-
-                    if self._same_month_year:
-                        if day < self.day:
-                            self.month_work_days_before_today += 1
-                            self.total_hours_before_today += day_work_hours
-                        else:
-                            self.month_work_days_after_today += 1
-                            self.total_hours_after_today += day_work_hours
-
-        self.total_hours += self._flex_hours
-        self.total_hours_before_today += self._flex_hours
-
-        self.salary = self.total_hours * self.hourly_wage
-
-        self.salary_before_today = self.total_hours_before_today * self.hourly_wage
-        self.salery_before_today_with_hourly_update = (
-            self.total_hours_before_today + self.today_hours
-        ) * self.hourly_wage
-        self.salary_after_today = self.total_hours_after_today * self.hourly_wage
+                    self.earning = True
+                    self.anchor_at = tmp_start + timedelta(minutes=self.today_minutes)
+
+            self.anchor_at = self.anchor_at or tmp_now
+            self.rate_changes_at = self.next_shift_event(tmp_now)
+
+        tmp_first: date = date(self.year, self.month, 1)
+        tmp_last: date = date(
+            self.year, self.month, monthrange(self.year, self.month)[1]
+        )
+
+        if self._same_month_year:
+            tmp_today: date = date(self.year, self.month, self.day)
+
+            # Days already worked are taken from the presence entity if tracked
+            tmp_before: MonthAggregate = self.range_aggregate(
+                tmp_first, tmp_today - timedelta(days=1), self.worked_minutes
+            )
+            tmp_after: MonthAggregate = self.range_aggregate(
+                tmp_today + timedelta(days=1), tmp_last
+            )
+
+            if (tmp_today_minutes := self.day_work_minutes(tmp_today)) != 0:
+                tmp_today_aggregate: MonthAggregate = (
+                    tmp_before if tmp_today_done else tmp_after
+                )
+                tmp_today_aggregate.work_days += 1
+                tmp_today_aggregate.minutes += tmp_today_minutes
+
+            self.month_work_days_before_today = tmp_before.work_days
+            self.total_minutes_before_today = tmp_before.minutes
+            self.month_work_days_after_today = tmp_after.work_days
+            self.total_minutes_after_today = tmp_after.minutes
+            self.month_work_days = tmp_before.work_days + tmp_after.work_days
+            self.total_minutes = tmp_before.minutes + tmp_after.minutes
+
+        else:
+            tmp_month: MonthAggregate = self.range_aggregate(tmp_first, tmp_last)
+            self.month_work_days = tmp_month.work_days
+            self.total_minutes = tmp_month.minutes
+
+        self.total_minutes += self._flex_minutes
+        self.total_minutes_before_today += self._flex_minutes
+
+        self.salary_minor = wage_for_minutes(self.total_minutes, self.hourly_wage_minor)
+
+        self.salary_before_today_minor = wage_for_minutes(
+            self.total_minutes_before_today, self.hourly_wage_minor
+        )
+        self.salery_before_today_with_hourly_update_minor = wage_for_minutes(
+            self.total_minutes_before_today + self.today_minutes,
+            self.hourly_wage_minor,
+        )
+        self.salary_after_today_minor = wage_for_minutes(
+            self.total_minutes_after_today, self.hourly_wage_minor
+        )
+
+        if self.tax_table is not None:
+            self.net_salary_minor = self.tax_table.net_minor(self.salary_minor)
+
+        if self._same_month_year:
+            self.calculate_year()
+
+    # ------------------------------------------------------------------
+    @property
+    def earning_rate_minor(self) -> float:
+        """Earning rate in minor currency units per second."""
+
+        return self.hourly_wage_minor / 3600 if self.earning else 0.0
+
+    # ------------------------------------------------------------------
+    def month_aggregate(self, year: int, month: int) -> MonthAggregate:
+        """Get cached aggregate of a month."""
+
+        if (tmp_aggregate := self._month_aggregates.get((year, month))) is not None:
+            return tmp_aggregate
+
+        tmp_aggregate = self.range_aggregate(
+            date(year, month, 1), date(year, month, monthrange(year, month)[1])
+        )
+
+        self._month_aggregates[(year, month)] = tmp_aggregate
+        self.month_aggregates_changed = True
+        return tmp_aggregate
+
+    # ------------------------------------------------------------------
+    def clear_month_aggregates(self, year: int = 0, month: int = 0) -> None:
+        """Clear cached month aggregates, all or for a single month.
+
+        Must be called when the schedule or the holidays changes.
+        """
+
+        if year == 0 or month == 0:
+            self._month_aggregates.clear()
+            self.month_aggregates_changed = True
+
+        elif self._month_aggregates.pop((year, month), None) is not None:
+            # Stored aggregates of the month must be dropped at next save
+            self.month_aggregates_changed = True
+
+    # ------------------------------------------------------------------
+    def month_aggregates_signature(self, version: str = "") -> str:
+        """Signature of the inputs the month aggregates are computed from.
+
+        Date overrides are saved with a delay, so they are part of the
+        signature, aggregates saved with other overrides are discarded.
+        """
+
+        return sha1(
+            repr(
+                (
+                    self.schedule.minutes,
+                    self.schedule.anchor,
+                    self.country,
+                    self.holidays.signature,
+                    sorted(self.date_overrides.items()),
+                    version,
+                )
+            ).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+
+    # ------------------------------------------------------------------
+    def inputs_signature(self) -> str:
+        """Signature of the inputs the scheduled days are computed from."""
+
+        return sha1(
+            repr(
+                (
+                    *self.schedule.signature,
+                    self.country,
+                    self.holidays.signature,
+                    self.hourly_wage_minor,
+                    self.currency_digits,
+                    sorted(self.calendar_overlay.items()),
+                    sorted(self.date_overrides.items()),
+                )
+            ).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+
+    # ------------------------------------------------------------------
+    def export_month_aggregates(self) -> dict[str, list[int]]:
+        """Export month aggregates, except the current month.
+
+        The current month can change with the calendar overlay.
+        """
+
+        self.month_aggregates_changed = False
+
+        return {
+            f"{year:04d}-{month:02d}": [aggregate.work_days, aggregate.minutes]
+            for (year, month), aggregate in self._month_aggregates.items()
+            if (year, month) != (date.today().year, date.today().month)
+        }
+
+    # ------------------------------------------------------------------
+    def import_month_aggregates(self, months: dict[str, list[int]]) -> None:
+        """Import month aggregates."""
+
+        for key, (work_days, minutes) in months.items():
+            self._month_aggregates.setdefault(
+                (int(key[0:4]), int(key[5:7])), MonthAggregate(work_days, minutes)
+            )
+
+    # ------------------------------------------------------------------
+    def calculate_year(self) -> None:
+        """Calculate year to date and full year projection.
+
+        Other months are taken from the cached month aggregates, the current
+        month from the live values.
+        """
+
+        self.ytd_minutes = self.total_minutes_before_today + self.today_minutes
+        self.ytd_salary_minor = self.salery_before_today_with_hourly_update_minor
+        self.year_minutes = self.total_minutes
+        self.year_salary_minor = self.salary_minor
+        tmp_month_salaries_minor: list[int] = [self.salary_minor]
+
+        for month in range(1, 13):
+            if month == self.month:
+                continue
+
+            tmp_aggregate: MonthAggregate = self.month_aggregate(self.year, month)
+            tmp_salary_minor: int = wage_for_minutes(
+                tmp_aggregate.minutes, self.hourly_wage_minor
+            )
+
+            if month < self.month:
+                self.ytd_minutes += tmp_aggregate.minutes
+                self.ytd_salary_minor += tmp_salary_minor
+
+            self.year_minutes += tmp_aggregate.minutes
+            self.year_salary_minor += tmp_salary_minor
+            tmp_month_salaries_minor.append(tmp_salary_minor)
+
+        # Tax is withheld per month, so the year is the sum of the months.
+        # The months only change with the salary of the current month.
+        if self.tax_table is not None and self._year_net_key != tuple(
+            tmp_month_salaries_minor
+        ):
+            self._year_net_key = tuple(tmp_month_salaries_minor)
+            self.year_net_salary_minor = sum(
+                self.tax_table.net_minor_many(tmp_month_salaries_minor)
+            )
+
+    # ------------------------------------------------------------------
+    def result_key(self) -> tuple:
+        """Key of the calculated values, used to detect changes.
+
+        While earning, the values of today are interpolated by clients from
+        the anchor and left out, so changes are only detected when the rate
+        changes. The shift events of the ticker updates at those changes.
+        """
+
+        tmp_today: tuple = (
+            # The anchor moves with the minutes of today, its shift start not
+            (self.anchor_at - timedelta(minutes=self.today_minutes),)
+            if self.earning
+            else (
+                self.today_minutes,
+                self.salery_before_today_with_hourly_update_minor,
+                self.ytd_salary_minor,
+            )
+        )
+
+        return (
+            self.year,
+            self.month,
+            self.day,
+            self.month_work_days,
+            self.month_work_days_before_today,
+            self.month_work_days_after_today,
+            self.total_minutes,
+            self.total_minutes_before_today,
+            self.total_minutes_after_today,
+            self._flex_minutes,
+            self.salary_minor,
+            self.year_salary_minor,
+            self.earning,
+            self.rate_changes_at,
+            *tmp_today,
+        )
+
+    # ------------------------------------------------------------------
+    @property
+    def flex_minutes(self) -> int:
+        """Get flex minutes."""
+        return self._flex_minutes
+
+    # ------------------------------------------------------------------
+    @flex_minutes.setter
+    def flex_minutes(self, minutes: int) -> None:
+        """Set flex minutes, values are updated at the next calculate."""
+        self._flex_minutes = minutes
 
     # ------------------------------------------------------------------
     @property
     def flex_hours(self) -> float:
         """Get flex hours."""
-        return self._flex_hours
+        return minutes_to_hours(self._flex_minutes)
 
     # ------------------------------------------------------------------
     @flex_hours.setter
     def flex_hours(self, hours: float) -> None:
-        """Set flex hours."""
-        self._flex_hours = hours
-        self.calculate(self.year, self.month)
+        """Set flex hours, values are updated at the next calculate."""
+        self._flex_minutes = hours_to_minutes(hours)
 
     # ------------------------------------------------------------------
     def __str__(self) -> str:
         """Representation of MonthlyWorkHours as as string."""
         return (
             f"Month work days before today: {self.month_work_days_before_today:>10}\n"
-            f"Total hours before today:     {self.total_hours_before_today:>10,.2f}\n"
-            f"Salary before today:         {self.salary_before_today:>10,.2f}\n"
+            f"Total hours before today:     {minutes_to_hours(self.total_minutes_before_today):>10,.2f}\n"
+            f"Salary before today:         {self.to_amount(self.salary_before_today_minor):>10,.2f}\n"
             f"Month work days after today:  {self.month_work_days_after_today:>10}\n"
-            f"Total hours after today:      {self.total_hours_after_today:>10,.2f}\n"
-            f"Salary after today:          {self.salary_after_today:>10,.2f}\n"
+            f"Total hours after today:      {minutes_to_hours(self.total_minutes_after_today):>10,.2f}\n"
+            f"Salary after today:          {self.to_amount(self.salary_after_today_minor):>10,.2f}\n"
             f"Month work days:              {self.month_work_days:>10}\n"
             f"Flex hours:                   {self.flex_hours:>10,.2f}\n"
-            f"Total hours:                  {self.total_hours:>10,.2f}\n"
-            f"Wage:                      {self.salary:>10,.2f}\n"
+            f"Total hours:                  {minutes_to_hours(self.total_minutes):>10,.2f}\n"
+            f"Wage:                      {self.to_amount(self.salary_minor):>10,.2f}\n"
         )
@@ -0,0 +1,207 @@
+"""Websocket api for Wage calculator."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    SIGNAL_ENTRY_LOADED,
+    SIGNAL_ENTRY_REMOVED,
+    SIGNAL_ENTRY_UNLOADED,
+    WEBSOCKET_RELOAD_TIMEOUT,
+)
+
+
+# ------------------------------------------------------------------
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register websocket commands."""
+
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+# ------------------------------------------------------------------
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Required("entry_ids"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to the wage results of one or more entries.
+
+    A snapshot with all fields per entry is sent first, followed by deltas
+    with only the changed fields of an entry. Subscriptions follow entries
+    across reloads and are closed with an error if an entry is removed, or
+    is not loaded again within a timeout after being unloaded.
+    """
+
+    tmp_entries: dict[str, ConfigEntry] = {}
+
+    for entry_id in msg["entry_ids"]:
+        if (
+            (entry := hass.config_entries.async_get_entry(entry_id)) is None
+            or entry.domain != DOMAIN
+            or entry.state is not ConfigEntryState.LOADED
+        ):
+            connection.send_error(
+                msg["id"], websocket_api.ERR_NOT_FOUND, f"Entry {entry_id} not found"
+            )
+            return
+
+        tmp_entries[entry_id] = entry
+
+    tmp_sent: dict[str, dict[str, Any]] = {}
+    tmp_listeners: dict[str, CALLBACK_TYPE] = {}
+    tmp_reload_timers: dict[str, CALLBACK_TYPE] = {}
+    tmp_unsubs: list[CALLBACK_TYPE] = []
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_send_delta(entry_id: str) -> None:
+        tmp_fields: dict[str, Any] = tmp_entries[
+            entry_id
+        ].runtime_data.component_api.result_fields()
+        tmp_changes: dict[str, Any] = {
+            key: value
+            for key, value in tmp_fields.items()
+            if tmp_sent[entry_id].get(key) != value
+        }
+
+        if len(tmp_changes) == 0:
+            return
+
+        tmp_sent[entry_id] = tmp_fields
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"delta": {entry_id: tmp_changes}})
+        )
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_attach(entry_id: str) -> None:
+        """Listen to the coordinator of the current runtime data."""
+
+        if (tmp_listener := tmp_listeners.pop(entry_id, None)) is not None:
+            tmp_listener()
+
+        tmp_listeners[entry_id] = tmp_entries[
+            entry_id
+        ].runtime_data.coordinator.async_add_listener(
+            partial(async_send_delta, entry_id)
+        )
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_entry_loaded(entry_id: str) -> None:
+        """Entry reloaded, reattach and send what changed meanwhile."""
+
+        if (tmp_timer := tmp_reload_timers.pop(entry_id, None)) is not None:
+            tmp_timer()
+
+        async_attach(entry_id)
+        async_send_delta(entry_id)
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_entry_unloaded(entry_id: str) -> None:
+        """Entry unloaded, detach and wait for it to be loaded again."""
+
+        if (tmp_listener := tmp_listeners.pop(entry_id, None)) is not None:
+            tmp_listener()
+
+        if (tmp_timer := tmp_reload_timers.pop(entry_id, None)) is not None:
+            tmp_timer()
+
+        tmp_reload_timers[entry_id] = async_call_later(
+            hass,
+            WEBSOCKET_RELOAD_TIMEOUT,
+            partial(async_reload_timeout, entry_id),
+        )
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_reload_timeout(entry_id: str, _now: datetime) -> None:
+        """Entry not loaded again, like when the reload failed."""
+
+        tmp_reload_timers.pop(entry_id, None)
+        async_close(f"Entry {entry_id} is not loaded")
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_entry_removed(entry_id: str) -> None:
+        """Entry removed, close the subscription."""
+
+        async_close(f"Entry {entry_id} removed")
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_close(message: str) -> None:
+        """Close the subscription with an error."""
+
+        if connection.subscriptions.pop(msg["id"], None) is None:
+            return
+
+        async_unsubscribe()
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, message)
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_unsubscribe() -> None:
+        for unsub in [
+            *tmp_listeners.values(),
+            *tmp_reload_timers.values(),
+            *tmp_unsubs,
+        ]:
+            unsub()
+
+        tmp_listeners.clear()
+        tmp_reload_timers.clear()
+        tmp_unsubs.clear()
+
+    for entry_id, entry in tmp_entries.items():
+        tmp_sent[entry_id] = entry.runtime_data.component_api.result_fields()
+        async_attach(entry_id)
+        tmp_unsubs.append(
+            async_dispatcher_connect(
+                hass,
+                SIGNAL_ENTRY_LOADED.format(entry_id),
+                partial(async_entry_loaded, entry_id),
+            )
+        )
+        tmp_unsubs.append(
+            async_dispatcher_connect(
+                hass,
+                SIGNAL_ENTRY_UNLOADED.format(entry_id),
+                partial(async_entry_unloaded, entry_id),
+            )
+        )
+        tmp_unsubs.append(
+            async_dispatcher_connect(
+                hass,
+                SIGNAL_ENTRY_REMOVED.format(entry_id),
+                partial(async_entry_removed, entry_id),
+            )
+        )
+
+    connection.subscriptions[msg["id"]] = async_unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"snapshot": dict(tmp_sent)})
+    )
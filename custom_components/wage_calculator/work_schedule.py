@@ -0,0 +1,247 @@
+"""Work schedule.
+
+Engine of the scheduled work without Home Assistant, shared by the wage calc
+and the simulations running in worker processes.
+"""
+
+from calendar import monthrange
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from itertools import accumulate
+
+from .holiday_set import iter_mask_days
+from .tax_table import TaxTable
+
+
+# ------------------------------------------------------------------
+def hours_to_minutes(hours: float) -> int:
+    """Convert hours to integer minutes."""
+
+    return round(hours * 60)
+
+
+# ------------------------------------------------------------------
+def minutes_to_hours(minutes: int) -> float:
+    """Convert integer minutes to hours for display."""
+
+    return round(minutes / 60, 2)
+
+
+# ------------------------------------------------------------------
+def wage_for_minutes(minutes: int, hourly_wage_minor: int) -> int:
+    """Wage in minor currency units for minutes, rounded half up."""
+
+    return (minutes * hourly_wage_minor * 2 + 60) // 120
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass
+class MonthAggregate:
+    """Scheduled work days and minutes of a month, without flex hours."""
+
+    work_days: int = 0
+    minutes: int = 0
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class WorkSchedule:
+    """Rotating work schedule.
+
+    Work minutes and start times are a cycle table of one or more weeks,
+    indexed by days since the Monday of the week the rotation starts.
+    """
+
+    def __init__(
+        self,
+        work_hours: list[float],
+        work_starts_at: list[str] | None = None,
+        rotation_start: date | None = None,
+    ) -> None:
+        """Init."""
+
+        self.minutes: list[int] = [hours_to_minutes(hours) for hours in work_hours]
+        self.starts: list[time] = [
+            datetime.strptime(t, "%H:%M:%S").time()
+            for t in work_starts_at or ["00:00:00"] * len(self.minutes)
+        ]
+        self.length: int = len(self.minutes)
+
+        tmp_rotation_start: date = rotation_start or date.min
+        self.anchor: int = tmp_rotation_start.toordinal() - tmp_rotation_start.weekday()
+
+        self._minutes_prefix: list[int] = [0, *accumulate(self.minutes)]
+        self._days_prefix: list[int] = [
+            0,
+            *accumulate(1 if minutes != 0 else 0 for minutes in self.minutes),
+        ]
+
+    # ------------------------------------------------------------------
+    @property
+    def signature(self) -> tuple:
+        """Inputs the schedule is computed from."""
+
+        return (self.minutes, self.starts, self.anchor)
+
+    # ------------------------------------------------------------------
+    def cycle_index(self, day: date) -> int:
+        """Index of a day in the cycle table."""
+
+        return (day.toordinal() - self.anchor) % self.length
+
+    # ------------------------------------------------------------------
+    def scheduled_minutes(self, day: date) -> int:
+        """Work minutes of a day from the rotation only."""
+
+        return self.minutes[self.cycle_index(day)]
+
+    # ------------------------------------------------------------------
+    def start_time(self, day: date) -> time:
+        """Start time of the shift of a day."""
+
+        return self.starts[self.cycle_index(day)]
+
+    # ------------------------------------------------------------------
+    def _cycle_sum(self, prefix: list[int], start: date, end: date) -> int:
+        """Sum of a cycle prefix table from start to end, both included."""
+
+        tmp_days: int = (end - start).days + 1
+        tmp_cycles, tmp_rest = divmod(tmp_days, self.length)
+        tmp_first: int = self.cycle_index(start)
+        tmp_last: int = tmp_first + tmp_rest
+        tmp_sum: int = tmp_cycles * prefix[self.length]
+
+        if tmp_last <= self.length:
+            return tmp_sum + prefix[tmp_last] - prefix[tmp_first]
+
+        return (
+            tmp_sum
+            + prefix[self.length]
+            - prefix[tmp_first]
+            + prefix[tmp_last - self.length]
+        )
+
+    # ------------------------------------------------------------------
+    def range_aggregate(
+        self,
+        start: date,
+        end: date,
+        exceptions: Iterable[date] = (),
+        day_minutes: Callable[[date], int] | None = None,
+    ) -> MonthAggregate:
+        """Work days and minutes from start to end, both included.
+
+        The rotation is summed with the cycle prefix sums, after which only
+        the exception days are corrected with the minutes of day minutes.
+        """
+
+        tmp_aggregate: MonthAggregate = MonthAggregate()
+
+        if end < start:
+            return tmp_aggregate
+
+        tmp_aggregate.work_days = self._cycle_sum(self._days_prefix, start, end)
+        tmp_aggregate.minutes = self._cycle_sum(self._minutes_prefix, start, end)
+
+        for day in exceptions:
+            tmp_scheduled: int = self.scheduled_minutes(day)
+            tmp_minutes: int = day_minutes(day) if day_minutes is not None else 0
+            tmp_aggregate.work_days += (tmp_minutes != 0) - (tmp_scheduled != 0)
+            tmp_aggregate.minutes += tmp_minutes - tmp_scheduled
+
+        return tmp_aggregate
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class SimulationScenario:
+    """Hypothetical schedule, picklable for worker processes.
+
+    Holidays are given as the bitmap per year of a holiday set, net pay is
+    estimated when a tax table is given.
+    """
+
+    name: str
+    work_hours: list[float]
+    rotation_start: date | None
+    hourly_wage_minor: int
+    holiday_masks: dict[int, int]
+    tax_table: TaxTable | None = None
+
+
+# ------------------------------------------------------------------
+def simulate_scenario(
+    scenario: SimulationScenario, start: date, end: date, monthly: bool = False
+) -> dict:
+    """Scheduled work and wage of a scenario from start to end, both included.
+
+    Months are computed and rounded like the sensors, so the wage is the sum
+    of the month wages. Only the scheduled work and holidays are simulated,
+    flex hours, date overrides and the calendar overlay are not, so the
+    result differs from the sensors of an entry using those. Runs in a
+    worker process.
+    """
+
+    tmp_schedule: WorkSchedule = WorkSchedule(
+        scenario.work_hours, rotation_start=scenario.rotation_start
+    )
+    tmp_result: dict = {
+        "name": scenario.name,
+        "work_days": 0,
+        "minutes": 0,
+        "wage_minor": 0,
+    }
+    tmp_months: list[dict] = []
+    tmp_wages_minor: list[int] = []
+    tmp_year, tmp_month = start.year, start.month
+
+    while (tmp_year, tmp_month) <= (end.year, end.month):
+        tmp_first: date = max(start, date(tmp_year, tmp_month, 1))
+        tmp_last: date = min(
+            end, date(tmp_year, tmp_month, monthrange(tmp_year, tmp_month)[1])
+        )
+        tmp_aggregate: MonthAggregate = tmp_schedule.range_aggregate(
+            tmp_first,
+            tmp_last,
+            iter_mask_days(
+                lambda year: scenario.holiday_masks.get(year, 0), tmp_first, tmp_last
+            ),
+        )
+        tmp_wage_minor: int = wage_for_minutes(
+            tmp_aggregate.minutes, scenario.hourly_wage_minor
+        )
+
+        tmp_result["work_days"] += tmp_aggregate.work_days
+        tmp_result["minutes"] += tmp_aggregate.minutes
+        tmp_result["wage_minor"] += tmp_wage_minor
+        tmp_wages_minor.append(tmp_wage_minor)
+
+        if monthly:
+            tmp_months.append(
+                {
+                    "month": f"{tmp_year:04d}-{tmp_month:02d}",
+                    "work_days": tmp_aggregate.work_days,
+                    "minutes": tmp_aggregate.minutes,
+                    "wage_minor": tmp_wage_minor,
+                }
+            )
+
+        if tmp_month == 12:
+            tmp_year, tmp_month = tmp_year + 1, 1
+        else:
+            tmp_month += 1
+
+    if scenario.tax_table is not None:
+        tmp_nets_minor: list[int] = scenario.tax_table.net_minor_many(tmp_wages_minor)
+        tmp_result["net_minor"] = sum(tmp_nets_minor)
+
+        for month, net_minor in zip(tmp_months, tmp_nets_minor, strict=False):
+            month["net_minor"] = net_minor
+
+    if monthly:
+        tmp_result["months"] = tmp_months
+
+    return tmp_result